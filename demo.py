@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 
 from pydantic import Field
@@ -8,6 +9,8 @@ from oxygent.prompts import INTENTION_PROMPT
 
 Config.set_agent_llm_model("default_llm")
 
+logger = logging.getLogger(__name__)
+
 
 async def workflow(oxy_request: OxyRequest):
     short_memory = oxy_request.get_short_memory()
@@ -60,10 +63,13 @@ async def joke_tool(joke_type: str = Field(description="The type of the jokes"))
 
 
 def update_query(oxy_request: OxyRequest) -> OxyRequest:
-    print(oxy_request.shared_data)
-    user_query = oxy_request.get_query(master_level=True)
-    current_query = oxy_request.get_query()
-    print(user_query + "\n" + current_query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("shared_data: %s", oxy_request.shared_data)
+        logger.debug(
+            "user query: %s\ncurrent query: %s",
+            oxy_request.get_query(master_level=True),
+            oxy_request.get_query(),
+        )
     oxy_request.arguments["who"] = oxy_request.callee
     return oxy_request
 
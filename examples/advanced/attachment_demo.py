@@ -1,41 +1,10 @@
 import asyncio
-import json
 
 from oxygent import MAS, Config, OxyRequest, OxyResponse, oxy
 from oxygent.preset_tools import file_tools
-from oxygent.schemas import LLMResponse, LLMState
-from oxygent.utils.common_utils import extract_first_json
-from oxygent.utils.env_utils import get_env_var
-
-
-def func_parse_llm_response(ori_response: str, oxy_request: OxyRequest) -> LLMResponse:
-    try:
-        if "</think>" in ori_response:
-            ori_response = ori_response.split("</think>")[-1].strip()
-        tool_call_dict = json.loads(extract_first_json(ori_response))
-        if "tool_name" in tool_call_dict:
-            return LLMResponse(
-                state=LLMState.TOOL_CALL,
-                output=tool_call_dict,
-                ori_response=ori_response,
-            )
-        return LLMResponse(
-            state=LLMState.ANSWER, output=ori_response, ori_response=ori_response
-        )
-    except json.JSONDecodeError:
-        if all(tk in ori_response for tk in ["tool_name", "arguments", "{", "}"]):
-            return LLMResponse(
-                state=LLMState.ERROR_PARSE,
-                output="can not parse json, please regenerate the answer.",
-                ori_response=ori_response,
-            )
-        return LLMResponse(
-            state=LLMState.ANSWER, output=ori_response, ori_response=ori_response
-        )
-    except Exception as e:
-        return LLMResponse(
-            state=LLMState.ERROR_PARSE, output=e, ori_response=ori_response
-        )
+from oxygent.utils.common_utils import install_uvloop
+from oxygent.utils.env_utils import get_llm_env
+from oxygent.utils.llm_parse import func_parse_llm_response
 
 
 async def master_file_workflow(oxy_request: OxyRequest) -> OxyResponse:
@@ -51,12 +20,14 @@ async def master_file_workflow(oxy_request: OxyRequest) -> OxyResponse:
 
 Config.set_agent_llm_model("default_chat")
 
+llm_env = get_llm_env()
+
 oxy_space = [
     oxy.HttpLLM(
         name="default_chat",
-        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
-        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
-        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+        api_key=llm_env.api_key,
+        base_url=llm_env.base_url,
+        model_name=llm_env.model_name,
         llm_params={"temperature": 0.3, "max_tokens": 2048},
     ),
     file_tools,
@@ -86,10 +57,14 @@ async def main():
 
 
 async def web():
+    # Fewer gen-0 collections while serving many short ReAct requests
+    Config.set_server_gc_threshold((50_000, 50, 10))
+    Config.set_server_gc_freeze(True)
     async with MAS(oxy_space=oxy_space) as mas:
         await mas.start_web_service(first_query="Introduce the content of the file")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     # asyncio.run(main())
     asyncio.run(web())
@@ -1,6 +1,6 @@
 import os
 
-from oxygent import MAS, oxy
+from oxygent import MAS, Config, oxy
 
 oxy_space = [
     oxy.HttpLLM(
@@ -16,6 +16,9 @@ oxy_space = [
 
 
 async def main():
+    # Fewer gen-0 collections while streaming many small deltas
+    Config.set_server_gc_threshold((50_000, 50, 10))
+    Config.set_server_gc_freeze(True)
     async with MAS(oxy_space=oxy_space) as mas:
         await mas.start_web_service(first_query="你好")
 
@@ -14,13 +14,13 @@ import asyncio
 from oxygent import MAS, OxyRequest, OxyResponse, oxy
 from oxygent.oxy.agents.base_agent import BaseAgent
 from oxygent.schemas import OxyState
-from oxygent.utils.env_utils import get_env_var
+from oxygent.utils.common_utils import install_uvloop
+from oxygent.utils.env_utils import get_llm_env
 
 
 class CounterAgent(BaseAgent):
     async def execute(self, oxy_request: OxyRequest):
-        cnt = oxy_request.get_global("counter", 0) + 1
-        oxy_request.set_global("counter", cnt)
+        cnt = oxy_request.incr_global_data("counter")
 
         return OxyResponse(
             state=OxyState.COMPLETED,
@@ -29,12 +29,14 @@ class CounterAgent(BaseAgent):
         )
 
 
+llm_env = get_llm_env()
+
 oxy_space = [
     oxy.HttpLLM(
         name="default_llm",
-        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
-        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
-        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+        api_key=llm_env.api_key,
+        base_url=llm_env.base_url,
+        model_name=llm_env.model_name,
         llm_params={"temperature": 0.01},
         semaphore=4,
         timeout=240,
@@ -61,4 +63,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
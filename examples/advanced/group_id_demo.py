@@ -3,14 +3,17 @@
 import asyncio
 
 from oxygent import MAS, oxy
-from oxygent.utils.env_utils import get_env_var
+from oxygent.utils.common_utils import install_uvloop
+from oxygent.utils.env_utils import get_llm_env
+
+llm_env = get_llm_env()
 
 oxy_space = [
     oxy.HttpLLM(
         name="default_llm",
-        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
-        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
-        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+        api_key=llm_env.api_key,
+        base_url=llm_env.base_url,
+        model_name=llm_env.model_name,
         llm_params={"temperature": 0.01},
         semaphore=4,
         timeout=240,
@@ -53,4 +56,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -1,12 +1,15 @@
 import asyncio
+import logging
 
 from pydantic import Field
 
 from oxygent import MAS, Config, OxyRequest, oxy
-from oxygent.utils.env_utils import get_env_var
+from oxygent.utils.env_utils import get_llm_env
 
 Config.set_agent_llm_model("default_llm")
 
+logger = logging.getLogger(__name__)
+
 
 async def workflow(oxy_request: OxyRequest):
     short_memory = oxy_request.get_short_memory()
@@ -46,20 +49,25 @@ async def joke_tool(joke_type: str = Field(description="The type of the jokes"))
 
 
 def update_query(oxy_request: OxyRequest):
-    print(oxy_request.shared_data)
-    user_query = oxy_request.get_query(master_level=True)
-    current_query = oxy_request.get_query()
-    print(user_query + "\n" + current_query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("shared_data: %s", oxy_request.shared_data)
+        logger.debug(
+            "user query: %s\ncurrent query: %s",
+            oxy_request.get_query(master_level=True),
+            oxy_request.get_query(),
+        )
     oxy_request.arguments["who"] = oxy_request.callee
     return oxy_request
 
 
+llm_env = get_llm_env()
+
 oxy_space = [
     oxy.HttpLLM(
         name="default_llm",
-        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
-        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
-        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+        api_key=llm_env.api_key,
+        base_url=llm_env.base_url,
+        model_name=llm_env.model_name,
         llm_params={
             "temperature": 0.7,
             "max_tokens": 512,
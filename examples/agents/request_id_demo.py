@@ -3,15 +3,17 @@
 import asyncio
 
 from oxygent import MAS, oxy
-from oxygent.utils.common_utils import generate_uuid
-from oxygent.utils.env_utils import get_env_var
+from oxygent.utils.common_utils import generate_uuid, install_uvloop
+from oxygent.utils.env_utils import get_llm_env
+
+llm_env = get_llm_env()
 
 oxy_space = [
     oxy.HttpLLM(
         name="default_llm",
-        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
-        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
-        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+        api_key=llm_env.api_key,
+        base_url=llm_env.base_url,
+        model_name=llm_env.model_name,
         llm_params={"temperature": 0.01},
         semaphore=4,
         timeout=240,
@@ -24,19 +26,25 @@ oxy_space = [
 ]
 
 
+QUERIES = ["hello!", "what is AI?", "tell me a joke", "what can you do?"]
+
+
 async def main():
     async with MAS(oxy_space=oxy_space) as mas:
-        request_id = generate_uuid(length=22)
-        result = await mas.chat_with_agent(
-            {
-                "query": "hello!",
-                "request_id": request_id,
-            }
+        request_ids = [generate_uuid(length=22) for _ in QUERIES]
+        # Requests run concurrently, bounded by the LLM's semaphore.
+        results = await asyncio.gather(
+            *[
+                mas.chat_with_agent({"query": query, "request_id": request_id})
+                for query, request_id in zip(QUERIES, request_ids)
+            ]
         )
 
-        print("output :", result)
-        print("used request_id :", request_id)
+        for request_id, result in zip(request_ids, results):
+            print("used request_id :", request_id)
+            print("output :", result)
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -7,17 +7,45 @@ capturing screenshots, managing browser tabs, and automatic login capabilities
 using the Playwright framework.
 """
 
-from .content import browser_snapshot, browser_take_screenshot
-from .core import browser_check_status, check_dependencies, mcp
-from .interaction import browser_click, browser_hover, browser_type
-from .login import browser_auto_login
-from .navigation import (
-    browser_navigate,
-    browser_navigate_back,
-    browser_navigate_forward,
-)
-from .search import browser_search
-from .tabs import browser_tab_close, browser_tab_list, browser_tab_new
+import importlib
+
+# 工具名 -> 所在子模块；首次访问时才导入，避免加载包时拉起 playwright 等重依赖
+_LAZY_ATTRS = {
+    "mcp": "core",
+    "check_dependencies": "core",
+    "browser_check_status": "core",
+    "browser_navigate": "navigation",
+    "browser_navigate_back": "navigation",
+    "browser_navigate_forward": "navigation",
+    "browser_click": "interaction",
+    "browser_hover": "interaction",
+    "browser_type": "interaction",
+    "browser_snapshot": "content",
+    "browser_take_screenshot": "content",
+    "browser_tab_list": "tabs",
+    "browser_tab_new": "tabs",
+    "browser_tab_close": "tabs",
+    "browser_auto_login": "login",
+    "browser_search": "search",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == "mcp":
+        # 工具通过各子模块中的 @mcp.tool() 注册，取 mcp 时需全部导入
+        for tool_module in dict.fromkeys(_LAZY_ATTRS.values()):
+            importlib.import_module(f".{tool_module}", __name__)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # 导出所有工具函数，方便导入
 __all__ = [
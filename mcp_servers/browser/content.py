@@ -4,8 +4,10 @@
 提供捕获页面的可访问性快照和截取页面截图等功能
 """
 
+import asyncio
+import itertools
 import os
-import uuid
+import time
 from datetime import datetime
 
 from pydantic import Field
@@ -59,6 +61,20 @@ async def browser_snapshot():
         return f"捕获页面快照时发生错误: {str(e)}"
 
 
+# 截图文件名序号；时间戳前缀每秒只格式化一次
+_SCREENSHOT_COUNTER = itertools.count()
+_SCREENSHOT_PREFIX = [-1, ""]
+
+
+def _screenshot_filename():
+    """生成唯一的截图文件名：时间戳_进程号_序号.png"""
+    second = int(time.time())
+    if second != _SCREENSHOT_PREFIX[0]:
+        timestamp = datetime.fromtimestamp(second).strftime("%Y%m%d_%H%M%S")
+        _SCREENSHOT_PREFIX[:] = [second, f"{timestamp}_{os.getpid():x}"]
+    return f"{_SCREENSHOT_PREFIX[1]}_{next(_SCREENSHOT_COUNTER):04x}.png"
+
+
 @mcp.tool(description="截取页面截图")
 async def browser_take_screenshot(
     path: str = Field(
@@ -83,41 +99,22 @@ async def browser_take_screenshot(
         page = await _ensure_page()
 
         # 等待页面稳定
-        import asyncio
-
         await asyncio.sleep(0.5)
 
-        # 截取截图
-        screenshot_bytes = await page.screenshot(full_page=full_page)
-
-        # 计算图片大小（用于信息展示）
-        size_mb = len(screenshot_bytes) / (1024 * 1024)
-
         # 确定保存路径
         save_path = path
         if not save_path:
-            # 创建cache_dir目录（如果不存在）
-            cache_dir = os.path.join(os.getcwd(), "../", "cache_dir")
-            os.makedirs(cache_dir, exist_ok=True)
+            # 保存到cache_dir/screenshot目录
+            screenshot_dir = os.path.join(os.getcwd(), "../", "cache_dir", "screenshot")
 
-            # 创建screenshot子目录（如果不存在）
-            screenshot_dir = os.path.join(cache_dir, "screenshot")
-            os.makedirs(screenshot_dir, exist_ok=True)
+            # 完整的保存路径
+            save_path = os.path.join(screenshot_dir, _screenshot_filename())
 
-            # 生成唯一的文件名
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"{timestamp}_{unique_id}.png"
+        # 截取截图，由Playwright创建目录并异步写入文件
+        screenshot_bytes = await page.screenshot(path=save_path, full_page=full_page)
 
-            # 完整的保存路径
-            save_path = os.path.join(screenshot_dir, filename)
-        else:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
-
-        # 保存截图到文件
-        with open(save_path, "wb") as f:
-            f.write(screenshot_bytes)
+        # 计算图片大小（用于信息展示）
+        size_mb = len(screenshot_bytes) / (1024 * 1024)
 
         await _verify_data_ready()
         await _set_operation_status(False)
@@ -4,17 +4,39 @@
 提供状态检查和通用工具函数
 """
 
+import functools
 from urllib.parse import urlparse
 
 
-async def _get_domain_from_url(url):
-    """从URL中提取域名"""
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
+def _fast_domain(url):
+    """常见的 scheme://host/... 形式直接切片取 netloc，其余情况返回空串交给 urlparse"""
+    start = url.find("://")
+    if start <= 0 or not url[:start].isalpha():
+        return ""
+    start += 3
+    end = len(url)
+    for sep in "/?#":
+        index = url.find(sep, start)
+        if index != -1 and index < end:
+            end = index
+    return url[start:end].lower()
+
+
+@functools.lru_cache(maxsize=1024)
+def _domain_sync(url):
+    """从URL中提取域名（同一URL在登录检查、导航跳转中反复出现，结果做缓存）"""
+    domain = _fast_domain(url)
+    if domain:
         return domain
-    except:
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
         return ""
 
 
+async def _get_domain_from_url(url):
+    """从URL中提取域名"""
+    return _domain_sync(url)
+
+
 # 函数已移至core.py文件
@@ -5,6 +5,8 @@ import logging
 import os
 import re
 
+_ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
+
 
 def deep_update(d, u):
     for k, v in u.items():
@@ -16,14 +18,13 @@ def deep_update(d, u):
 
 def replace_env_var(val):
     """Convert ${VAR} in strings to environment variables recursively."""
-    pattern = re.compile(r"\$\{(\w+)\}")
     if isinstance(val, str):
 
         def replacer(match):
             var_name = match.group(1)
             return os.environ.get(var_name, "")
 
-        return pattern.sub(replacer, val)
+        return _ENV_VAR_PATTERN.sub(replacer, val)
     elif isinstance(val, dict):
         return {k: replace_env_var(v) for k, v in val.items()}
     elif isinstance(val, list):
@@ -62,6 +63,14 @@ class Config:
         "cache": {
             "save_dir": "./cache_dir",
         },
+        "llm_cache": {
+            "is_enabled": False,
+            "is_semantic": False,
+            "semantic_threshold": 0.92,
+            "max_temperature": 0.2,
+            "capacity": 4096,
+            "prewarm_queries": [],
+        },
         "message": {
             "is_send_tool_call": True,
             "is_send_observation": True,
@@ -92,6 +101,8 @@ class Config:
             "port": 8080,
             "auto_open_webpage": True,
             "log_level": "INFO",
+            "gc_threshold": None,
+            "gc_freeze": False,
         },
         "agent": {
             "prompt": "",
@@ -308,6 +319,64 @@ class Config:
             os.makedirs(save_dir, exist_ok=True)
         return save_dir
 
+    """ llm_cache """
+
+    @classmethod
+    def set_llm_cache_config(cls, llm_cache_config):
+        return cls.set_module_config("llm_cache", llm_cache_config)
+
+    @classmethod
+    def get_llm_cache_config(cls):
+        return cls.get_module_config("llm_cache")
+
+    @classmethod
+    def set_llm_cache_is_enabled(cls, is_enabled=True):
+        cls.set_module_config("llm_cache", "is_enabled", is_enabled)
+
+    @classmethod
+    def get_llm_cache_is_enabled(cls):
+        return cls.get_module_config("llm_cache", "is_enabled", False)
+
+    @classmethod
+    def set_llm_cache_is_semantic(cls, is_semantic=True):
+        cls.set_module_config("llm_cache", "is_semantic", is_semantic)
+
+    @classmethod
+    def get_llm_cache_is_semantic(cls):
+        return cls.get_module_config("llm_cache", "is_semantic", False)
+
+    @classmethod
+    def set_llm_cache_semantic_threshold(cls, semantic_threshold):
+        cls.set_module_config("llm_cache", "semantic_threshold", semantic_threshold)
+
+    @classmethod
+    def get_llm_cache_semantic_threshold(cls):
+        return cls.get_module_config("llm_cache", "semantic_threshold", 0.92)
+
+    @classmethod
+    def set_llm_cache_max_temperature(cls, max_temperature):
+        cls.set_module_config("llm_cache", "max_temperature", max_temperature)
+
+    @classmethod
+    def get_llm_cache_max_temperature(cls):
+        return cls.get_module_config("llm_cache", "max_temperature", 0.2)
+
+    @classmethod
+    def set_llm_cache_capacity(cls, capacity):
+        cls.set_module_config("llm_cache", "capacity", capacity)
+
+    @classmethod
+    def get_llm_cache_capacity(cls):
+        return cls.get_module_config("llm_cache", "capacity", 4096)
+
+    @classmethod
+    def set_llm_cache_prewarm_queries(cls, prewarm_queries):
+        cls.set_module_config("llm_cache", "prewarm_queries", prewarm_queries)
+
+    @classmethod
+    def get_llm_cache_prewarm_queries(cls):
+        return cls.get_module_config("llm_cache", "prewarm_queries", [])
+
     """ message """
 
     @classmethod
@@ -528,6 +597,22 @@ class Config:
     def get_server_log_level(cls):
         return cls.get_module_config("server", "log_level")
 
+    @classmethod
+    def set_server_gc_threshold(cls, gc_threshold):
+        cls.set_module_config("server", "gc_threshold", gc_threshold)
+
+    @classmethod
+    def get_server_gc_threshold(cls):
+        return cls.get_module_config("server", "gc_threshold")
+
+    @classmethod
+    def set_server_gc_freeze(cls, gc_freeze):
+        cls.set_module_config("server", "gc_freeze", gc_freeze)
+
+    @classmethod
+    def get_server_gc_freeze(cls):
+        return cls.get_module_config("server", "gc_freeze")
+
     """ agent """
 
     @classmethod
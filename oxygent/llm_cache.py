@@ -0,0 +1,165 @@
+"""Response cache for LLM calls.
+
+Cached responses are looked up in two tiers:
+    - exact: sha256 of the request parameters and the messages; only
+      surrounding whitespace of the final user query is ignored
+    - semantic: when every message except the final user query matches
+      exactly, the query is embedded and compared against cached queries by
+      cosine similarity
+
+When a capacity is set, the least recently used entry is evicted from both
+tiers once the cache is full.
+
+The semantic tier relies on the embedding service configured for Vearch, see
+:func:`~embedding_cache.get_embedding`.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+
+import numpy as np
+
+from .embedding_cache import get_embedding
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text) -> str:
+    """Collapse whitespace and lowercase *text*; non-strings are JSON-encoded."""
+    if not isinstance(text, str):
+        text = json.dumps(text, ensure_ascii=False, sort_keys=True, default=str)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+
+
+def _canonical_json(value) -> str:
+    """Encode *value* as key-sorted JSON without altering its content."""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _sha256(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory exact + semantic cache for LLM outputs.
+
+    Example:
+        >>> cache = LLMResponseCache(semantic_threshold=0.92)
+        >>> output = await cache.get(payload)
+        >>> if output is None:
+        ...     output = await call_llm(payload)
+        ...     await cache.set(payload, output)
+    """
+
+    def __init__(self, semantic_threshold=None, capacity=None):
+        """Create an empty cache.
+
+        Args:
+            semantic_threshold (float, optional): Minimum cosine similarity for
+                a semantic hit. ``None`` disables the semantic tier.
+            capacity (int, optional): Maximum number of cached responses.
+                ``None`` keeps every response.
+        """
+        self.semantic_threshold = semantic_threshold
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        # exact key -> output, least recently used first
+        self._exact = OrderedDict()
+        # context key -> {exact key: query embedding}
+        self._semantic = {}
+        # exact key -> context key, for entries indexed in the semantic tier
+        self._contexts = {}
+        # exact key -> query embedding computed during a missed lookup
+        self._pending_embeddings = {}
+
+    @staticmethod
+    def _split_payload(payload: dict):
+        """Return (params, context, query) digests/texts for *payload*."""
+        params = _canonical_json(
+            {k: v for k, v in payload.items() if k not in ("messages", "contents")}
+        )
+        messages = payload.get("messages")
+        if not isinstance(messages, list):
+            return params, _canonical_json(payload.get("contents")), ""
+        if messages and messages[-1].get("role") == "user":
+            context, query = messages[:-1], messages[-1].get("content", "")
+        else:
+            context, query = messages, ""
+        # Case and inner whitespace may be meaningful (code, identifiers), so
+        # fuzzier query matching is left to the semantic tier
+        query = query.strip() if isinstance(query, str) else _canonical_json(query)
+        return params, _canonical_json(context), query
+
+    @property
+    def _is_semantic(self) -> bool:
+        return self.semantic_threshold is not None
+
+    async def _embed(self, text: str):
+        embeddings = await get_embedding([text])
+        if embeddings is None:
+            return None
+        return embeddings[0]
+
+    async def get(self, payload: dict):
+        """Return the cached output for *payload*, or ``None`` on a miss."""
+        params, context, query = self._split_payload(payload)
+        key = _sha256(params, context, query)
+        if key in self._exact:
+            self.hits += 1
+            self._exact.move_to_end(key)
+            return self._exact[key]
+
+        entry = self._semantic.get(_sha256(params, context))
+        if self._is_semantic and query and entry:
+            embedding = await self._embed(query)
+            if embedding is not None:
+                self._remember_pending(key, embedding)
+                keys = list(entry)
+                similarities = np.stack(list(entry.values())) @ embedding
+                index = int(np.argmax(similarities))
+                if similarities[index] >= self.semantic_threshold:
+                    self.hits += 1
+                    self._exact.move_to_end(keys[index])
+                    return self._exact[keys[index]]
+        self.misses += 1
+        return None
+
+    async def set(self, payload: dict, output):
+        """Store *output* as the response to *payload*."""
+        params, context, query = self._split_payload(payload)
+        key = _sha256(params, context, query)
+        self._exact[key] = output
+        self._exact.move_to_end(key)
+
+        if self._is_semantic and query:
+            embedding = self._pending_embeddings.pop(key, None)
+            if embedding is None:
+                embedding = await self._embed(query)
+            if embedding is not None:
+                context_key = _sha256(params, context)
+                self._semantic.setdefault(context_key, {})[key] = embedding
+                self._contexts[key] = context_key
+
+        while self.capacity is not None and len(self._exact) > self.capacity:
+            self._evict(next(iter(self._exact)))
+
+    def _remember_pending(self, key: str, embedding):
+        self._pending_embeddings[key] = embedding
+        if self.capacity is not None and len(self._pending_embeddings) > self.capacity:
+            self._pending_embeddings.pop(next(iter(self._pending_embeddings)))
+
+    def _evict(self, key: str):
+        del self._exact[key]
+        context_key = self._contexts.pop(key, None)
+        if context_key is None:
+            return
+        entry = self._semantic[context_key]
+        del entry[key]
+        if not entry:
+            del self._semantic[context_key]
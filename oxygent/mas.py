@@ -18,6 +18,7 @@ NOTE: This module contains the following parts:
 # from __future__ import annotations
 
 import asyncio
+import gc
 import json
 import os
 import traceback
@@ -220,17 +221,39 @@ class MAS(BaseModel):
         # Build the agent organization structure
         self.init_agent_organization()
         self.show_org()
+        # Warm the LLM caches with expected queries in the background
+        prewarm_queries = Config.get_llm_cache_prewarm_queries()
+        if prewarm_queries:
+            prewarm_task = asyncio.create_task(self.prewarm(prewarm_queries))
+            prewarm_task.add_done_callback(self.background_tasks.discard)
+            self.background_tasks.add(prewarm_task)
+
+    async def prewarm(self, queries) -> None:
+        """Run *queries* through the master agent to populate the LLM caches.
+
+        Responses are discarded and the runs are not written to the chat
+        history; they only fill the HttpLLM response caches (and ReActAgent
+        plan caches where enabled) so that matching user queries hit them.
+        Failures are logged and do not affect startup.
+        """
+        for query in queries:
+            try:
+                await self.chat_with_agent(
+                    payload={"query": query, "is_save_history": False}
+                )
+            except Exception as e:
+                logger.warning(f"Prewarm query {query!r} failed: {e}")
 
     async def cleanup_servers(self) -> None:
         """Gracefully shut down remote servers/clients.
 
         The method concurrently calls ``cleanup()`` on every
-        :class:`BaseMCPClient` that has been registered.  It is automatically
-        invoked by :func:`__aexit__`.
+        :class:`BaseMCPClient` and :class:`BaseLLM` that has been registered.
+        It is automatically invoked by :func:`__aexit__`.
         """
         cleanup_tasks = []
         for oxy in self.oxy_name_to_oxy.values():
-            if not isinstance(oxy, BaseMCPClient):
+            if not isinstance(oxy, (BaseMCPClient, BaseLLM)):
                 continue
             cleanup_tasks.append(asyncio.create_task(oxy.cleanup()))
 
@@ -607,6 +630,10 @@ class MAS(BaseModel):
                 },
             )
         await self.redis_client.lpush(redis_key, bytes_msg)
+        # Wake up an in-process SSE stream waiting on this key
+        event = self.event_dict.get(redis_key)
+        if event is not None:
+            event.set()
 
     async def chat_with_agent(
         self,
@@ -805,10 +832,17 @@ class MAS(BaseModel):
                 lambda future: self.active_tasks.pop(current_trace_id, None)
             )
             self.active_tasks[current_trace_id] = task
+            event = self.event_dict.setdefault(redis_key, asyncio.Event())
             while True:
+                event.clear()
                 bytes_msg = await self.redis_client.rpop(redis_key)
                 if bytes_msg is None:
-                    await asyncio.sleep(0.1)
+                    # Messages sent from this process set the event, so deltas
+                    # are flushed immediately; the timeout covers other senders.
+                    try:
+                        await asyncio.wait_for(event.wait(), timeout=0.1)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
                 message = msgpack.unpackb(bytes_msg)
                 if message:
@@ -846,6 +880,8 @@ class MAS(BaseModel):
             )
             self.active_tasks[current_trace_id].cancel()
             raise
+        finally:
+            self.event_dict.pop(redis_key, None)
 
     async def start_web_service(
         self, first_query=None, welcome_message=None, host=None, port=None
@@ -1092,6 +1128,15 @@ class MAS(BaseModel):
             )
             server = uvicorn.Server(config)
 
+            if Config.get_server_gc_freeze():
+                # Move long-lived startup objects (oxy_space, app, modules) out of
+                # the collector's reach so per-request garbage collections stay short
+                gc.collect()
+                gc.freeze()
+            gc_threshold = Config.get_server_gc_threshold()
+            if gc_threshold:
+                gc.set_threshold(*gc_threshold)
+
             await server.serve()
 
         web_task = asyncio.create_task(run_uvicorn())
@@ -1112,13 +1157,17 @@ class MAS(BaseModel):
     # Batch helper
     # ------------------------------------------------------------------
 
-    async def start_batch_processing(self, querys, return_trace_id=False):
+    async def start_batch_processing(
+        self, querys, return_trace_id=False, max_concurrency=None
+    ):
         """Execute a batch of queries concurrently.
 
         Args:
             querys: Iterable of natural-language prompts.
             return_trace_id: If ``True`` the trace ID is returned together
                 with each answer - handy for offline audits.
+            max_concurrency: Maximum number of queries running at the same
+                time. ``None`` runs the whole batch at once.
 
         Returns:
             list: Answers (or dicts with *output* + *trace_id*).
@@ -1126,8 +1175,15 @@ class MAS(BaseModel):
         import time
 
         cost_times = []
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
 
         async def handle_query(query):
+            if semaphore is None:
+                return await run_query(query)
+            async with semaphore:
+                return await run_query(query)
+
+        async def run_query(query):
             start_time = time.time()
             from_trace_id = ""
             payload = {
@@ -26,6 +26,8 @@ from .base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+_PROMPT_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
+
 
 class LocalAgent(BaseAgent):
     """Local agent with tool management and memory capabilities.
@@ -332,13 +334,12 @@ class LocalAgent(BaseAgent):
         Returns:
             str: The formatted instruction string with variables substituted.
         """
-        pattern = re.compile(r"\$\{(\w+)\}")
 
         def replacer(match):
             key = match.group(1)
             return str(arguments.get(key, match.group(0)))
 
-        return pattern.sub(replacer, self.prompt.strip())
+        return _PROMPT_VAR_PATTERN.sub(replacer, self.prompt.strip())
 
     async def _pre_process(self, oxy_request: OxyRequest) -> OxyRequest:
         """Pre-process request to load conversation history if needed.
@@ -6,13 +6,17 @@ with tool execution in an iterative loop.
 """
 
 import asyncio
+import copy
+import dataclasses
 import json
 import logging
+import time
 from typing import Callable, Optional
 
 from pydantic import Field
 
 from ...config import Config
+from ...llm_cache import normalize_text
 from ...prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_RETRIEVAL
 from ...schemas import (
     ExecResult,
@@ -30,6 +34,15 @@ from .local_agent import LocalAgent
 
 logger = logging.getLogger(__name__)
 
+# Longest stretch a ReAct loop may run before giving other coroutines a turn
+_YIELD_INTERVAL = 0.025
+
+
+def _copy_plan(llm_response: LLMResponse) -> LLMResponse:
+    # Tool calls hand their arguments dict to the callee, which may fill it in
+    # (e.g. short_memory), so cached plans never share it with a live call
+    return dataclasses.replace(llm_response, output=copy.deepcopy(llm_response.output))
+
 
 class ReActAgent(LocalAgent):
     """Agent implementing the ReAct (Reasoning and Acting) paradigm.
@@ -57,6 +70,10 @@ class ReActAgent(LocalAgent):
         is_discard_react_memory (bool): Whether to discard detailed ReAct memory.
         memory_max_tokens (int): Maximum tokens for memory management.
         trust_mode (bool): Whether to enable trust mode for direct tool results.
+        is_plan_cache (bool): Whether to reuse the first-round tool call chosen
+            for a previously seen query instead of asking the LLM again.
+        max_concurrency (int): Maximum number of tool calls from a single LLM
+            round that run at the same time.
 
     TODO:
         - LLM model: Support both service URLs and weight files for training
@@ -79,6 +96,15 @@ class ReActAgent(LocalAgent):
 
     trust_mode: bool = Field(False, description="Enable trust mode for direct results")
 
+    is_plan_cache: bool = Field(
+        False, description="Whether to reuse first-round tool calls of repeated queries"
+    )
+    plan_cache_size: int = Field(1024, description="Maximum number of cached plans")
+
+    max_concurrency: int = Field(
+        10, description="Maximum number of parallel tool calls per round"
+    )
+
     func_parse_llm_response: Optional[Callable[[str, OxyRequest], LLMResponse]] = Field(
         None, exclude=True, description="Function to parse LLM output"
     )
@@ -101,10 +127,51 @@ class ReActAgent(LocalAgent):
         if self.func_reflexion is None:
             self.func_reflexion = self._default_reflexion
 
+        # (instruction, normalized query) -> first-round tool call LLMResponse
+        self._plan_cache: dict = {}
+
         # Add retrieve_tools if vector search is conf igured
         if Config.get_vearch_config():
             self.tools.append("retrieve_tools")
 
+    def _get_plan_key(self, oxy_request: OxyRequest, instruction: str):
+        """Return the plan cache key of a request, or None if it is not cacheable.
+
+        Only context-free text queries are cached: with short memory present
+        the same query can refer to different things.
+        """
+        query = oxy_request.arguments.get("query", "")
+        if (
+            not self.is_plan_cache
+            or not isinstance(query, str)
+            or oxy_request.get_short_memory()
+        ):
+            return None
+        return instruction, normalize_text(query)
+
+    def _set_plan(self, plan_key, llm_response: LLMResponse) -> None:
+        if len(self._plan_cache) >= self.plan_cache_size:
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[plan_key] = _copy_plan(llm_response)
+
+    def _get_plan(self, plan_key) -> Optional[LLMResponse]:
+        llm_response = self._plan_cache.get(plan_key)
+        return _copy_plan(llm_response) if llm_response else None
+
+    async def _call_tool(
+        self,
+        oxy_request: OxyRequest,
+        tool_call_dict: dict,
+        semaphore: asyncio.Semaphore,
+        parallel_id: str,
+    ) -> OxyResponse:
+        async with semaphore:
+            return await oxy_request.call(
+                callee=tool_call_dict["tool_name"],
+                arguments=tool_call_dict["arguments"],
+                parallel_id=parallel_id,
+            )
+
     def _default_reflexion(self, response: str, oxy_request: OxyRequest) -> str:
         """Default reflexion function that checks if response is empty or invalid.
 
@@ -325,12 +392,17 @@ class ReActAgent(LocalAgent):
             return str(q)
 
         react_memory = Memory()
+        last_yield = time.monotonic()
         for current_round in range(self.max_react_rounds + 1):
+            # Cache hits and local tools can complete a round without ever
+            # suspending, so yield explicitly to keep the event loop responsive
+            if time.monotonic() - last_yield >= _YIELD_INTERVAL:
+                await asyncio.sleep(0)
+                last_yield = time.monotonic()
             # Build complete message context: instruction + short memory + query + react memory
             temp_memory = Memory()
-            temp_memory.add_message(
-                Message.system_message(self._build_instruction(oxy_request.arguments))
-            )
+            instruction = self._build_instruction(oxy_request.arguments)
+            temp_memory.add_message(Message.system_message(instruction))
             temp_memory.add_messages(
                 Message.dict_list_to_messages(oxy_request.get_short_memory())
             )
@@ -344,14 +416,23 @@ class ReActAgent(LocalAgent):
             temp_memory.add_messages(react_memory.messages)
 
             full_memory = temp_memory.to_dict_list()
-            oxy_response = await oxy_request.call(
-                callee=self.llm_model,
-                arguments={"messages": full_memory},
+            plan_key = (
+                self._get_plan_key(oxy_request, instruction)
+                if current_round == 0
+                else None
             )
+            llm_response = self._get_plan(plan_key) if plan_key else None
+            if llm_response is None:
+                oxy_response = await oxy_request.call(
+                    callee=self.llm_model,
+                    arguments={"messages": full_memory},
+                )
+                llm_response = self.func_parse_llm_response(
+                    oxy_response.output, oxy_request
+                )
+                if plan_key and llm_response.state is LLMState.TOOL_CALL:
+                    self._set_plan(plan_key, llm_response)
             oxy_request.arguments["full_memory"] = full_memory
-            llm_response = self.func_parse_llm_response(
-                oxy_response.output, oxy_request
-            )
 
             # Execute based on LLM decision
             if llm_response.state is LLMState.ANSWER:
@@ -372,12 +453,12 @@ class ReActAgent(LocalAgent):
                     )
 
                 parallel_id = generate_uuid()
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+
                 oxy_responses = await asyncio.gather(
                     *[
-                        oxy_request.call(
-                            callee=tool_call_dict["tool_name"],
-                            arguments=tool_call_dict["arguments"],
-                            parallel_id=parallel_id,
+                        self._call_tool(
+                            oxy_request, tool_call_dict, semaphore, parallel_id
                         )
                         for tool_call_dict in tool_call_dict_list
                     ]
@@ -8,6 +8,7 @@ consistent interface for different LLM providers.
 import copy
 import json
 import logging
+import os
 from typing import Optional
 
 from pydantic import Field
@@ -43,6 +44,8 @@ class BaseLLM(Oxy):
         is_convert_url_to_base64: Whether to convert media URLs to base64.
         max_image_pixels: Maximum pixel count for image processing.
         max_video_size: Maximum size in bytes for video processing.
+        max_base64_cache_size: Maximum number of converted local files kept in
+            memory, so that ReAct rounds do not re-read unchanged attachments.
     """
 
     category: str = Field("llm", description="")
@@ -77,6 +80,35 @@ class BaseLLM(Oxy):
         default=2 * 1024 * 1024,
         description="Maximum non-media file size (bytes) for base64 embedding.",
     )
+    max_base64_cache_size: int = Field(
+        default=32, description="Maximum number of cached base64 conversions."
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # (item type, path, limit, size, mtime) -> base64 data URI
+        self._base64_cache: dict = {}
+
+    async def _url_to_base64(self, item_type: str, func, url: str, limit: int) -> str:
+        """Convert *url* with *func*, reusing the result for unchanged local files.
+
+        Local files are keyed by their size and mtime, so an attachment is read
+        and encoded once per agent run instead of once per LLM call. Remote URLs
+        are always fetched.
+        """
+        try:
+            stat = None if url.startswith("http") else os.stat(url)
+        except OSError:
+            stat = None
+        if stat is None or self.max_base64_cache_size <= 0:
+            return await func(url, limit)
+
+        key = (item_type, url, limit, stat.st_size, stat.st_mtime_ns)
+        if key not in self._base64_cache:
+            if len(self._base64_cache) >= self.max_base64_cache_size:
+                self._base64_cache.pop(next(iter(self._base64_cache)))
+            self._base64_cache[key] = await func(url, limit)
+        return self._base64_cache[key]
 
     async def _get_messages(self, oxy_request: OxyRequest):
         """Preprocess messages for multimoding input."""
@@ -111,12 +143,18 @@ class BaseLLM(Oxy):
                     continue
 
                 if item_type == "image_url":
-                    item[item_type]["url"] = await image_to_base64(
-                        item[item_type]["url"], self.max_image_pixels
+                    item[item_type]["url"] = await self._url_to_base64(
+                        item_type,
+                        image_to_base64,
+                        item[item_type]["url"],
+                        self.max_image_pixels,
                     )
                 elif item_type == "video_url":
-                    item[item_type]["url"] = await video_to_base64(
-                        item[item_type]["url"], self.max_video_size
+                    item[item_type]["url"] = await self._url_to_base64(
+                        item_type,
+                        video_to_base64,
+                        item[item_type]["url"],
+                        self.max_video_size,
                     )
                 elif item_type in {
                     "table_file",
@@ -126,8 +164,11 @@ class BaseLLM(Oxy):
                     "file",
                 }:
                     try:
-                        item[item_type]["url"] = await file_to_base64(
-                            item[item_type]["url"], self.max_file_size_bytes
+                        item[item_type]["url"] = await self._url_to_base64(
+                            item_type,
+                            file_to_base64,
+                            item[item_type]["url"],
+                            self.max_file_size_bytes,
                         )
                     except Exception as e:
                         logger.warning(
@@ -152,6 +193,10 @@ class BaseLLM(Oxy):
         """Execute the LLM request."""
         raise NotImplementedError("This method is not yet implemented")
 
+    async def cleanup(self) -> None:
+        """Release client resources held by the LLM, e.g. pooled connections."""
+        pass
+
     async def _post_send_message(self, oxy_response: OxyResponse):
         """Send think messages to the frontend after response generation.
 
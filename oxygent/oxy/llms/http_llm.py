@@ -5,17 +5,34 @@ communicating with remote language model APIs over HTTP. It supports various LLM
 providers that follow OpenAI-compatible API standards.
 """
 
-import json
+import hashlib
+import importlib.util
 import logging
+from typing import Optional
 
 import httpx
+import orjson
+from pydantic import Field
 
 from ...config import Config
+from ...llm_cache import LLMResponseCache
 from ...schemas import OxyRequest, OxyResponse, OxyState
+from ...utils.common_utils import StreamJSONScanner
+from ...utils.rate_limit import TokenBucket
+from ...utils.single_flight import single_flight
 from .remote_llm import RemoteLLM
 
 logger = logging.getLogger(__name__)
 
+# Pool settings shared by every HttpLLM client; keep-alive connections are
+# reused across calls so that each request does not pay a new TCP/TLS handshake.
+HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=256, max_keepalive_connections=64, keepalive_expiry=60
+)
+
+# httpx only negotiates HTTP/2 when the optional h2 package is installed
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 
 class HttpLLM(RemoteLLM):
     """HTTP-based Large Language Model implementation.
@@ -23,8 +40,143 @@ class HttpLLM(RemoteLLM):
     This class provides a concrete implementation of RemoteLLM for communicating
     with remote LLM APIs over HTTP. It handles API authentication, request
     formatting, and response parsing for OpenAI-compatible APIs.
+
+    Attributes:
+        is_stop_stream_on_tool_call: Whether to stop reading a streamed response
+            as soon as a complete tool call JSON has arrived, so that the caller
+            can dispatch the tool without waiting for trailing tokens.
+        is_cache_response: Whether to serve repeated non-streaming requests
+            from an in-memory response cache (see :mod:`oxygent.llm_cache`).
+        is_cache_system_prompt: Whether to mark the leading system message with
+            ``cache_control`` so that providers with explicit prompt caching
+            (e.g. Anthropic-compatible endpoints) reuse its prefill across turns.
+            OpenAI-style endpoints cache identical prefixes automatically and
+            may reject the extra field, so this is off by default.
+        is_single_flight: Whether identical non-streaming requests that are in
+            flight at the same time share one upstream call. Only sensible for
+            deterministic (low temperature) requests, so it is off by default.
+        requests_per_minute: Maximum number of upstream requests per minute;
+            excess requests wait instead of tripping provider 429s.
+        tokens_per_minute: Maximum number of prompt tokens per minute,
+            estimated as a quarter of the request body size.
+        is_http2: Whether the pooled client negotiates HTTP/2, multiplexing
+            concurrent calls over one connection. Requires ``httpx[http2]``;
+            without it HttpLLM logs a warning and stays on HTTP/1.1. Ignored
+            when a client is passed in.
+
+    A pre-built ``httpx.AsyncClient`` can be passed as ``http_client`` to share
+    one connection pool between several HttpLLM instances. Its lifecycle stays
+    with the caller: :meth:`cleanup` only closes clients HttpLLM created itself.
     """
 
+    is_stop_stream_on_tool_call: bool = Field(
+        False,
+        description="Whether to stop streaming once a complete tool call is received.",
+    )
+    is_cache_response: bool = Field(
+        default_factory=Config.get_llm_cache_is_enabled,
+        description="Whether to cache responses of low-temperature requests.",
+    )
+    is_cache_system_prompt: bool = Field(
+        False,
+        description="Whether to mark the system prompt as cacheable by the provider.",
+    )
+    is_single_flight: bool = Field(
+        False,
+        description="Whether concurrent identical requests share one upstream call.",
+    )
+    requests_per_minute: Optional[int] = Field(
+        None, description="Upstream request rate limit, None for unlimited."
+    )
+    tokens_per_minute: Optional[int] = Field(
+        None, description="Estimated prompt token rate limit, None for unlimited."
+    )
+    is_http2: bool = Field(
+        False, description="Whether the pooled HTTP client should use HTTP/2."
+    )
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._http_client: Optional[httpx.AsyncClient] = http_client
+        self._is_shared_http_client = http_client is not None
+        if self.is_http2 and not _HAS_H2 and not self._is_shared_http_client:
+            logger.warning(
+                f"{self.name}: HTTP/2 requested but h2 is not installed, "
+                "falling back to HTTP/1.1. Install it with: pip install 'httpx[http2]'"
+            )
+        self._request_bucket: Optional[TokenBucket] = None
+        if self.requests_per_minute:
+            self._request_bucket = TokenBucket.per_minute(self.requests_per_minute)
+        self._token_bucket: Optional[TokenBucket] = None
+        if self.tokens_per_minute:
+            self._token_bucket = TokenBucket.per_minute(self.tokens_per_minute)
+        self._response_cache: Optional[LLMResponseCache] = None
+        if self.is_cache_response:
+            self._response_cache = LLMResponseCache(
+                semantic_threshold=Config.get_llm_cache_semantic_threshold()
+                if Config.get_llm_cache_is_semantic()
+                else None,
+                capacity=Config.get_llm_cache_capacity(),
+            )
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._is_shared_http_client:
+            return self._http_client
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                limits=HTTP_CLIENT_LIMITS,
+                http2=self.is_http2 and _HAS_H2,
+            )
+        return self._http_client
+
+    async def cleanup(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._http_client is not None and not self._is_shared_http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _acquire_rate_limit(self, body: bytes) -> None:
+        """Wait for the configured request/token budgets before calling upstream."""
+        if self._request_bucket is not None:
+            await self._request_bucket.acquire(1)
+        if self._token_bucket is not None:
+            await self._token_bucket.acquire(len(body) // 4)
+
+    @staticmethod
+    def _mark_system_prompt_cacheable(messages: list) -> list:
+        """Return *messages* with a ``cache_control`` breakpoint on the system prompt.
+
+        The input list is left untouched since it may be the request's own
+        ``messages`` argument.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return messages
+        system_message = dict(messages[0])
+        content = system_message.get("content")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            content = [dict(part) for part in content]
+        else:
+            return messages
+        content[-1]["cache_control"] = {"type": "ephemeral"}
+        system_message["content"] = content
+        return [system_message, *messages[1:]]
+
+    @staticmethod
+    def _is_tool_call(json_text: str) -> bool:
+        try:
+            tool_call_dict = orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            return False
+        return (
+            isinstance(tool_call_dict, dict)
+            and "tool_name" in tool_call_dict
+            and "arguments" in tool_call_dict
+        )
+
     async def _execute(self, oxy_request: OxyRequest) -> OxyResponse:
         """Execute an HTTP request to the remote LLM API.
 
@@ -89,8 +241,11 @@ class HttpLLM(RemoteLLM):
                     "model_name",
                 }
             }
+            messages = await self._get_messages(oxy_request)
+            if self.is_cache_system_prompt:
+                messages = self._mark_system_prompt_cacheable(messages)
             payload = {
-                "messages": await self._get_messages(oxy_request),
+                "messages": messages,
                 "model": self.model_name,
                 "stream": False,
             }
@@ -102,68 +257,116 @@ class HttpLLM(RemoteLLM):
                     continue
                 payload[k] = v
 
+        is_cacheable = (
+            self._response_cache is not None
+            and not payload.get("stream", False)
+            and payload.get("temperature", 1.0)
+            <= Config.get_llm_cache_max_temperature()
+        )
+        if is_cacheable:
+            cached_output = await self._response_cache.get(payload)
+            if cached_output is not None:
+                return OxyResponse(state=OxyState.COMPLETED, output=cached_output)
+
+        # headers already carry Content-Type: application/json; non-str keys are
+        # stringified like the stdlib json encoder httpx used before
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
         if payload.get("stream", False) and (use_openai or not is_gemini):
             result_parts: list[str] = []
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream(
-                    "POST", url, headers=headers, json=payload
-                ) as resp:
-                    async for line in resp.aiter_lines():
-                        if not line:
-                            continue
-                        if line.startswith("data:"):
-                            line = line[5:].strip()
-                        if line.strip() == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-                        except Exception as e:
-                            logger.error(
-                                e,
-                                extra={
-                                    "trace_id": oxy_request.current_trace_id,
-                                    "node_id": oxy_request.node_id,
-                                },
-                            )
-                        if use_openai:
-                            delta = chunk["choices"][0]["delta"].get(
-                                "content", ""
-                            ) or chunk["choices"][0]["delta"].get(
-                                "reasoning_content", ""
-                            )
-                        else:
-                            delta = chunk.get("message", {}).get(
-                                "content", ""
-                            ) or chunk.get("message", {}).get("reasoning_content", "")
-                        if delta:
-                            result_parts.append(delta)
-                            await oxy_request.send_message(
-                                {"type": "stream", "content": {"delta": delta}}
-                            )
+            scanner = StreamJSONScanner() if self.is_stop_stream_on_tool_call else None
+            await self._acquire_rate_limit(body)
+            client = self._get_http_client()
+            async with client.stream(
+                "POST", url, headers=headers, content=body, timeout=None
+            ) as resp:
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    if line.startswith("data:"):
+                        line = line[5:].strip()
+                    if line.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    except Exception as e:
+                        logger.error(
+                            e,
+                            extra={
+                                "trace_id": oxy_request.current_trace_id,
+                                "node_id": oxy_request.node_id,
+                            },
+                        )
+                    if use_openai:
+                        delta = chunk["choices"][0]["delta"].get(
+                            "content", ""
+                        ) or chunk["choices"][0]["delta"].get("reasoning_content", "")
+                    else:
+                        delta = chunk.get("message", {}).get(
+                            "content", ""
+                        ) or chunk.get("message", {}).get("reasoning_content", "")
+                    if delta:
+                        result_parts.append(delta)
+                        await oxy_request.send_message(
+                            {"type": "stream", "content": {"delta": delta}}
+                        )
+                        if scanner is not None:
+                            json_text = scanner.feed(delta)
+                            if json_text and self._is_tool_call(json_text):
+                                break
             result = "".join(result_parts)
             return OxyResponse(state=OxyState.COMPLETED, output=result)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            http_response = await client.post(url, headers=headers, json=payload)
-            http_response.raise_for_status()
-            data = http_response.json()
-            if "error" in data:
-                error_message = data["error"].get("message", "Unknown error")
-                raise ValueError(f"LLM API error: {error_message}")
-            if is_gemini:
-                result = (
-                    data["candidates"][0]["content"]["parts"][0].get("text", "")
-                    if data.get("candidates")
-                    else ""
-                )
-            elif use_openai:
-                response_message = data["choices"][0]["message"]
-                result = response_message.get("content") or response_message.get(
-                    "reasoning_content"
+        if self.is_single_flight:
+            # Headers carry the credentials, so callers with different keys
+            # never share a response
+            flight_key = hashlib.sha256(
+                b"\x1f".join(
+                    (
+                        url.encode(),
+                        orjson.dumps(headers, option=orjson.OPT_SORT_KEYS),
+                        body,
+                    )
                 )
-            else:  # ollama
-                result = data["message"]["content"]
+            ).hexdigest()
+            result = await single_flight(
+                flight_key,
+                lambda: self._post_completion(
+                    url, headers, body, is_gemini, use_openai
+                ),
+            )
+        else:
+            result = await self._post_completion(
+                url, headers, body, is_gemini, use_openai
+            )
 
-            return OxyResponse(state=OxyState.COMPLETED, output=result)
+        if is_cacheable and result:
+            await self._response_cache.set(payload, result)
+        return OxyResponse(state=OxyState.COMPLETED, output=result)
+
+    async def _post_completion(
+        self, url: str, headers: dict, body: bytes, is_gemini: bool, use_openai: bool
+    ):
+        """Send a non-streaming completion request and extract the output text."""
+        await self._acquire_rate_limit(body)
+        client = self._get_http_client()
+        http_response = await client.post(url, headers=headers, content=body)
+        http_response.raise_for_status()
+        data = orjson.loads(http_response.content)
+        if "error" in data:
+            error_message = data["error"].get("message", "Unknown error")
+            raise ValueError(f"LLM API error: {error_message}")
+        if is_gemini:
+            return (
+                data["candidates"][0]["content"]["parts"][0].get("text", "")
+                if data.get("candidates")
+                else ""
+            )
+        elif use_openai:
+            response_message = data["choices"][0]["message"]
+            return response_message.get("content") or response_message.get(
+                "reasoning_content"
+            )
+        else:  # ollama
+            return data["message"]["content"]
@@ -49,9 +49,10 @@ class SSEMCPClient(BaseMCPClient):
                     ClientSession(read, write)
                 )
                 # middlewares(optional)
+                add_middleware = getattr(self._session, "add_middleware", None)
                 for mw in self.middlewares:
-                    if hasattr(self._session, "add_middleware"):
-                        self._session.add_middleware(mw)
+                    if add_middleware is not None:
+                        add_middleware(mw)
                     else:
                         logger.warning(
                             "Current MCP client does not expose add_middleware(); "
@@ -25,20 +25,20 @@ class StreamableMCPClient(BaseMCPClient):
         """Initialize the HTTP streaming connection to the MCP server."""
         try:
             if not self.is_dynamic_headers and self.is_keep_alive:
-                self._http_transport = await self._exit_stack.enter_async_context(
+                read, write, _ = await self._exit_stack.enter_async_context(
                     streamablehttp_client(
                         build_url(self.server_url), headers=self.headers
                     )
                 )
-                read, write, _ = self._http_transport
 
                 self._session = await self._exit_stack.enter_async_context(
                     ClientSession(read, write)
                 )
 
+                add_middleware = getattr(self._session, "add_middleware", None)
                 for mw in self.middlewares:
-                    if hasattr(self._session, "add_middleware"):
-                        self._session.add_middleware(mw)
+                    if add_middleware is not None:
+                        add_middleware(mw)
                     else:
                         logger.warning("middleware %s is ignored", mw)
 
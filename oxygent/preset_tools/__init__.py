@@ -1,18 +1,22 @@
 import importlib
-from oxygent.oxy import FunctionHub
 import os
+import types
 
+from oxygent.oxy import FunctionHub
 
 # List of tool modules to import
 tool_modules = ["math_tools", "file_tools", "time_tools", "http_tools", "string_tools", "system_tools", "shell_tools",
                 "python_tools", "baidu_search_tools"]
 
-__all__ = []
+# Names of the FunctionHub instances that loaded successfully; `__all__` is built from it on first access
+_hub_names = []
 
 # Get the current package directory path
 package_dir = os.path.dirname(__file__)
 
-for module_name in tool_modules:
+
+def _load_tool_module(module_name):
+    """Import a tool module and bind its FunctionHub instances into the package scope."""
     module_path = os.path.join(package_dir, f"{module_name}.py")
 
     # First check if the module file exists
@@ -20,7 +24,7 @@ for module_name in tool_modules:
         print(
             f"Warning: Failed to import tool '{module_name}': Module file does not exist, please check '{module_path}'")
         globals()[module_name] = None
-        continue
+        return
 
     try:
         # Dynamically import the module
@@ -34,13 +38,14 @@ for module_name in tool_modules:
         ]
 
         if function_hub_instances:
-            # Add eligible instances to the current scope and __all__
+            # Add eligible instances to the current scope, replacing the submodule bound by the import
             for attr_name in function_hub_instances:
-                attr_value = getattr(module, attr_name)
-                globals()[attr_name] = attr_value
-                __all__.append(attr_name)
+                globals()[attr_name] = getattr(module, attr_name)
+                if attr_name not in _hub_names:
+                    _hub_names.append(attr_name)
         else:
             print(f"Warning: No FunctionHub instances found in module '{module_name}'")
+            globals()[module_name] = None
 
     except ImportError as e:
         # Catch import errors and extract the missing package name
@@ -61,3 +66,21 @@ for module_name in tool_modules:
 
         # Set the module entry to None to prevent errors in subsequent use
         globals()[module_name] = None
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # `from oxygent.preset_tools import *` only exports the tools that loaded
+        for module_name in tool_modules:
+            if module_name not in globals() or isinstance(globals()[module_name], types.ModuleType):
+                _load_tool_module(module_name)
+        globals()["__all__"] = list(_hub_names)
+        return globals()["__all__"]
+    if name not in tool_modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_tool_module(name)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(tool_modules))
@@ -1,6 +1,5 @@
 import json
 from typing import Optional, Dict, Any
-from pydantic import Field
 import httpx
 from oxygent.oxy import FunctionHub
 import asyncio
@@ -4,8 +4,18 @@ import asyncio
 from pydantic import Field
 from oxygent.oxy import FunctionHub
 
+try:
+    # Optional: google-re2 matches in linear time, so crafted inputs cannot trigger catastrophic backtracking
+    import re2 as _re
+except ImportError:
+    _re = re
+
 string_tools = FunctionHub(name="string_tools")
 
+_EMAIL_PATTERN = _re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_URL_PATTERN = _re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_VALID_EMAIL_PATTERN = _re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 @string_tools.tool(
     description="Extract email addresses from text"
@@ -16,8 +26,7 @@ async def extract_emails(
     """
     从文本中提取邮箱地址
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = _EMAIL_PATTERN.findall(text)
     return json.dumps(list(set(emails)), ensure_ascii=False)
 
 
@@ -30,8 +39,7 @@ async def extract_urls(
     """
     从文本中提取URL
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    urls = re.findall(url_pattern, text)
+    urls = _URL_PATTERN.findall(text)
     return json.dumps(list(set(urls)), ensure_ascii=False)
 
 
@@ -44,8 +52,7 @@ async def validate_email(
     """
     验证邮箱地址格式
     """
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    is_valid = bool(re.match(email_pattern, email))
+    is_valid = bool(_VALID_EMAIL_PATTERN.match(email))
     return json.dumps({"email": email, "is_valid": is_valid}, ensure_ascii=False)
 
 
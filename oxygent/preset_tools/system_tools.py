@@ -2,7 +2,6 @@ import json
 import platform
 import psutil
 import asyncio
-from pydantic import Field
 from oxygent.oxy import FunctionHub
 
 system_tools = FunctionHub(name="system_tools")
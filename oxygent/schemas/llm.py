@@ -3,11 +3,10 @@
 The module difines the status and the output of the LLM.
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Union
 
-from pydantic import BaseModel, Field
-
 
 class LLMState(Enum):
     TOOL_CALL = "tool_call"
@@ -16,7 +15,14 @@ class LLMState(Enum):
     ERROR_CALL = "error_call"
 
 
-class LLMResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LLMResponse:
+    """Parsed LLM output.
+
+    A plain slotted dataclass rather than a pydantic model: one is built for
+    every ReAct round and is never validated or serialised.
+    """
+
     state: LLMState
     output: Union[str, list, dict]
-    ori_response: str = Field(default="")
+    ori_response: str = ""
@@ -123,9 +123,6 @@ class OxyRequest(BaseModel):
         return oxy_name in self.mas.oxy_name_to_oxy
 
     def __deepcopy__(self, memo):
-        # Dump all the fields into a dict
-        fields = self.model_dump()
-
         # Quote messanger
         temp_data = {
             "mas": None,
@@ -134,6 +131,10 @@ class OxyRequest(BaseModel):
             "parallel_id": "",
             "latest_node_ids": [],
         }
+
+        # Dump the remaining fields into a dict; the fields above are shared or
+        # reset, so skip serializing them (mas would dump the whole system)
+        fields = self.model_dump(exclude=set(temp_data))
         for k, v in temp_data.items():
             fields[k] = v
         for k in fields:
@@ -370,6 +371,16 @@ class OxyRequest(BaseModel):
         else:
             return self.arguments.get("query", "")
 
+    def append_to_query(self, suffix: str, master_level=False) -> "OxyRequest":
+        """Append *suffix* to the text query in place and return this request.
+
+        Returning the request lets ``func_process_input`` hooks that only
+        decorate the query be written as ``lambda r: r.append_to_query("...")``.
+        """
+        data = self.shared_data if master_level else self.arguments
+        data["query"] = data.get("query", "") + suffix
+        return self
+
     def get_query_parts(self, master_level: bool = False) -> list:
         """
         Return the query as an **ordered parts list**.
@@ -471,6 +482,16 @@ class OxyRequest(BaseModel):
     def set_global_data(self, key, value):
         self.mas.global_data[key] = value
 
+    def incr_global_data(self, key, delta=1):
+        """Add *delta* to a numeric global value and return the new value.
+
+        The read and write happen without yielding to the event loop, so
+        concurrent agents in the same MAS never lose an increment.
+        """
+        global_data = self.mas.global_data
+        global_data[key] = value = global_data.get(key, 0) + delta
+        return value
+
     async def break_task(self):
         await self.send_message({"event": "close", "data": "done"})
         self.mas.active_tasks[self.current_trace_id].cancel()
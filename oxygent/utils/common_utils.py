@@ -17,13 +17,16 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import aiofiles
 import httpx
-import shortuuid
 from PIL import Image
 from pydantic import AnyUrl
 
 logger = logging.getLogger(__name__)
 Image.MAX_IMAGE_PIXELS = 400000000
 
+_JSON_FENCE_PATTERN = re.compile(r"```[\n]*json(.*?)```", re.DOTALL)
+# NOTE: this regex parsing is taken from langchain.output_parsers.pydantic
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.MULTILINE | re.IGNORECASE | re.DOTALL)
+
 
 def is_linux():
     return platform.system().lower() == "linux"
@@ -60,21 +63,75 @@ def chunk_list(lst, chunk_size=2):
 
 
 def extract_first_json(text):
-    matches = re.findall(r"```[\n]*json(.*?)```", text, re.DOTALL)
-    json_texts = [match.strip() for match in matches]
-    json_text = json_texts[0] if json_texts else text
+    match = _JSON_FENCE_PATTERN.search(text)
+    json_text = match.group(1).strip() if match else text
     if not json_text.startswith("{") or not json_text.endswith("}"):
         json_text = json_text[json_text.find("{") : json_text.rfind("}") + 1]
     return json_text
 
 
+class StreamJSONScanner:
+    """Incrementally locate complete top-level JSON objects in streamed text.
+
+    Feed the deltas of a streamed LLM response one by one; ``feed`` returns the
+    text of a JSON object as soon as its closing brace arrives, so callers do
+    not have to wait for the whole response. A leading ``<think>...</think>``
+    block is skipped.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._past_think = False
+
+    def feed(self, delta: str):
+        self.text += delta
+        text = self.text
+        if not self._past_think:
+            head = text.lstrip()
+            if head.startswith("<think>"):
+                think_end = text.find("</think>")
+                if think_end == -1:
+                    return None
+                self._pos = think_end + len("</think>")
+            elif "<think>".startswith(head):
+                return None
+            self._past_think = True
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self._depth:
+                self._in_string = True
+            elif ch == "{":
+                if not self._depth:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    self._pos = i + 1
+                    return text[self._start : i + 1]
+        self._pos = len(text)
+        return None
+
+
 def extract_json_str(text: str) -> str:
     """Extract JSON string from text.
 
     Only works for single JSON string.
     """
-    # NOTE: this regex parsing is taken from langchain.output_parsers.pydantic
-    match = re.search(r"\{.*\}", text.strip(), re.MULTILINE | re.IGNORECASE | re.DOTALL)
+    match = _JSON_OBJECT_PATTERN.search(text.strip())
     if not match:
         raise ValueError(f"Could not extract json string from output: {text}")
 
@@ -281,61 +338,36 @@ def to_json(obj):
     return json.dumps(obj, ensure_ascii=False, default=str)
 
 
+# file extension -> content item type, see process_attachments
+_ATTACHMENT_ITEM_TYPES = {
+    **dict.fromkeys(
+        (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff"), "image_url"
+    ),
+    **dict.fromkeys(
+        (".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv"), "video_url"
+    ),
+    **dict.fromkeys((".xlsx", ".xls", ".csv", ".tsv", ".ods"), "table_file"),
+    **dict.fromkeys((".doc", ".docx"), "doc_file"),
+    ".pdf": "pdf_file",
+    **dict.fromkeys((".py", ".md", ".json", ".txt"), "code_file"),
+}
+_MEDIA_ITEM_TYPES = frozenset(("image_url", "video_url"))
+
+
 def process_attachments(attachments):
     query_attachments = []
 
-    image_exts = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff")
-    video_exts = (".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv")
-    table_exts = (".xlsx", ".xls", ".csv", ".tsv", ".ods")
-    doc_exts = (".doc", ".docx")
-    pdf_exts = (".pdf",)
-    code_exts = (".py", ".md", ".json", ".txt")
-
     for attachment in attachments:
         if not (attachment.startswith("http") or os.path.exists(attachment)):
             logger.warning(f"Attachment file not found: {attachment}")
             continue
 
         ext = os.path.splitext(attachment.lower())[1]
-
-        if ext in image_exts:
-            query_attachments.append(
-                {"type": "image_url", "image_url": {"url": attachment}}
-            )
-        elif ext in video_exts:
-            query_attachments.append(
-                {"type": "video_url", "video_url": {"url": attachment}}
-            )
-        elif ext in table_exts:
-            query_attachments.append(
-                {
-                    "type": "table_file",
-                    "table_file": {"url": attachment, "format": ext.lstrip(".")},
-                }
-            )
-        elif ext in doc_exts:
-            query_attachments.append(
-                {
-                    "type": "doc_file",
-                    "doc_file": {"url": attachment, "format": ext.lstrip(".")},
-                }
-            )
-        elif ext in pdf_exts:
-            query_attachments.append(
-                {"type": "pdf_file", "pdf_file": {"url": attachment, "format": "pdf"}}
-            )
-        elif ext in code_exts:
-            query_attachments.append(
-                {
-                    "type": "code_file",
-                    "code_file": {"url": attachment, "format": ext.lstrip(".")},
-                }
-            )
-        else:
-            # fallback
-            query_attachments.append(
-                {"type": "file", "file": {"url": attachment, "format": ext.lstrip(".")}}
-            )
+        item_type = _ATTACHMENT_ITEM_TYPES.get(ext, "file")
+        item = {"url": attachment}
+        if item_type not in _MEDIA_ITEM_TYPES:
+            item["format"] = ext.lstrip(".")
+        query_attachments.append({"type": item_type, item_type: item})
 
     return query_attachments
 
@@ -365,4 +397,21 @@ def _compose_query_parts(original_query, attachments):
 
 
 def generate_uuid(length=16):
-    return shortuuid.ShortUUID().random(length=length)
+    """Return a random URL-safe id of *length* characters ([A-Za-z0-9_-])."""
+    random_bytes = os.urandom((length * 3 + 3) // 4)
+    return base64.urlsafe_b64encode(random_bytes)[:length].decode("ascii")
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy for asyncio when uvloop is installed.
+
+    Returns:
+        bool: Whether uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """Get environment variables."""
 
+import functools
 import os
 import socket
+from dataclasses import dataclass
 from typing import List, Type, Union
 
 
@@ -64,6 +66,29 @@ def get_env_var(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class LLMEnv:
+    """Connection settings of the default LLM, read from ``DEFAULT_LLM_*``."""
+
+    api_key: str
+    base_url: str
+    model_name: str
+
+
+@functools.lru_cache(maxsize=None)
+def get_llm_env() -> LLMEnv:
+    """Resolve the default LLM settings once per process.
+
+    Raises:
+        ValueError: If any of the ``DEFAULT_LLM_*`` variables is not set.
+    """
+    return LLMEnv(
+        api_key=get_env_var("DEFAULT_LLM_API_KEY"),
+        base_url=get_env_var("DEFAULT_LLM_BASE_URL"),
+        model_name=get_env_var("DEFAULT_LLM_MODEL_NAME"),
+    )
+
+
 def get_env_for_log_path():
     """Get log path :return:"""
     return get_env(key="LOG_PATH", default_val="/export/Logs")
@@ -0,0 +1,82 @@
+"""Lenient parser for ReAct-style LLM outputs shared by the demos."""
+
+import copy
+import dataclasses
+import functools
+
+import orjson
+
+from ..schemas import LLMResponse, LLMState
+from .common_utils import extract_first_json
+
+_THINK_END = "</think>"
+_TOOL_CALL_TOKENS = ("tool_name", "arguments", "{", "}")
+
+
+def parse_llm_response(ori_response: str) -> LLMResponse:
+    """Classify *ori_response* as a tool call, an answer or a parse error.
+
+    Unlike ``ReActAgent._parse_llm_response``, JSON without ``tool_name`` and
+    plain text are both treated as a final answer. The result depends only on
+    ``ori_response``, so retries that repeat the same text hit the cache.
+
+    Args:
+        ori_response (str): Raw LLM response text.
+
+    Returns:
+        LLMResponse: Parsed response with state and extracted content. A tool
+        call's ``output`` dict is a fresh copy, since callers hand its
+        ``arguments`` to sub-requests that modify them in place.
+    """
+    llm_response = _parse_llm_response_cached(ori_response)
+    if isinstance(llm_response.output, (dict, list)):
+        return dataclasses.replace(
+            llm_response, output=copy.deepcopy(llm_response.output)
+        )
+    return llm_response
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_llm_response_cached(ori_response: str) -> LLMResponse:
+    try:
+        think_end = ori_response.rfind(_THINK_END)
+        if think_end != -1:
+            ori_response = ori_response[think_end + len(_THINK_END) :].strip()
+        json_text = extract_first_json(ori_response)
+        # Plain answers carry no JSON object; skip raising JSONDecodeError for them
+        if not json_text.startswith("{"):
+            return _parse_non_json_response(ori_response)
+        tool_call_dict = orjson.loads(json_text)
+        if "tool_name" in tool_call_dict:
+            return LLMResponse(
+                state=LLMState.TOOL_CALL,
+                output=tool_call_dict,
+                ori_response=ori_response,
+            )
+        return LLMResponse(
+            state=LLMState.ANSWER, output=ori_response, ori_response=ori_response
+        )
+    except orjson.JSONDecodeError:
+        return _parse_non_json_response(ori_response)
+    except Exception as e:
+        return LLMResponse(
+            state=LLMState.ERROR_PARSE, output=e, ori_response=ori_response
+        )
+
+
+def _parse_non_json_response(ori_response: str) -> LLMResponse:
+    """Treat text without a parsable JSON object as an answer or a broken tool call."""
+    if all(tk in ori_response for tk in _TOOL_CALL_TOKENS):
+        return LLMResponse(
+            state=LLMState.ERROR_PARSE,
+            output="can not parse json, please regenerate the answer.",
+            ori_response=ori_response,
+        )
+    return LLMResponse(
+        state=LLMState.ANSWER, output=ori_response, ori_response=ori_response
+    )
+
+
+def func_parse_llm_response(ori_response: str, oxy_request=None) -> LLMResponse:
+    """Adapter matching the ``ReActAgent.func_parse_llm_response`` signature."""
+    return parse_llm_response(ori_response)
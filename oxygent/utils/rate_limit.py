@@ -0,0 +1,52 @@
+"""Asynchronous token-bucket rate limiter."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket that refills continuously up to ``capacity``.
+
+    Example:
+        >>> bucket = TokenBucket.per_minute(60)
+        >>> await bucket.acquire()  # waits once the burst of 60 is used up
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        """Create a full bucket.
+
+        Args:
+            capacity (float): Maximum number of tokens, i.e. the allowed burst.
+            refill_per_sec (float): Tokens added back per second.
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        """Bucket allowing *limit* tokens per minute with a burst of *limit*."""
+        return cls(capacity=limit, refill_per_sec=limit / 60)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_sec
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1):
+        """Wait until *tokens* are available and take them.
+
+        Requests larger than the capacity are clamped to it so that they can
+        still proceed once the bucket is full. Waiters are served in order.
+        """
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.refill_per_sec)
+                self._refill()
+            self._tokens -= tokens
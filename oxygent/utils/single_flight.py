@@ -0,0 +1,32 @@
+"""Coalesce identical concurrent coroutine calls into one execution."""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# key -> task of the call currently in flight
+_in_flight: dict = {}
+
+
+async def single_flight(key: Hashable, coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run ``coro_factory()`` once for all concurrent callers sharing *key*.
+
+    The first caller starts the call; callers arriving while it is still in
+    flight await the same task and receive its result or exception. The key is
+    released as soon as the call finishes, so later callers start a fresh one.
+    Cancelling one caller does not cancel the shared call for the others.
+
+    Args:
+        key (Hashable): Identity of the call, e.g. a digest of the request.
+        coro_factory (Callable): Zero-argument callable returning the awaitable.
+
+    Returns:
+        The result of the shared call.
+    """
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    return await asyncio.shield(task)
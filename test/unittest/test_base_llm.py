@@ -93,3 +93,29 @@ async def test_get_messages_url_to_base64(monkeypatch, llm, oxy_request):
 
         assert blob[1]["image_url"]["url"] == "img64"
         assert blob[2]["video_url"]["url"] == "vid64"
+
+
+@pytest.mark.asyncio
+async def test_get_messages_caches_local_base64(
+    monkeypatch, tmp_path, llm, oxy_request
+):
+    image = tmp_path / "a.png"
+    image.write_bytes(b"png")
+    oxy_request.arguments["messages"] = [
+        {
+            "role": "user",
+            "content": [{"type": "image_url", "image_url": {"url": str(image)}}],
+        }
+    ]
+    llm.is_convert_url_to_base64 = True
+
+    to_base64 = AsyncMock(return_value="img64")
+    monkeypatch.setattr("oxygent.oxy.llms.base_llm.image_to_base64", to_base64)
+
+    for _ in range(3):
+        msgs = await llm._get_messages(oxy_request)
+        assert msgs[0]["content"][0]["image_url"]["url"] == "img64"
+    assert to_base64.await_count == 1
+    assert oxy_request.arguments["messages"][0]["content"][0]["image_url"][
+        "url"
+    ] == str(image)
@@ -7,255 +7,165 @@
 import importlib.util
 import os
 import sys
-import unittest
 from unittest.mock import MagicMock, patch
 
-
-class TestBrowserServer(unittest.TestCase):
-    """测试browser/server.py的导入和基本功能"""
-
-    def test_server_imports(self):
-        """测试server.py能否正确导入所有依赖"""
-        # 获取server.py的绝对路径
-        server_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "mcp_servers/browser/server.py",
-            )
-        )
-
-        # 检查文件是否存在
-        self.assertTrue(
-            os.path.exists(server_path), f"server.py文件不存在: {server_path}"
-        )
-
-        # 模拟FastMCP类，避免实际运行MCP服务器
-        with patch("mcp.server.fastmcp.FastMCP") as mock_fastmcp:
-            # 模拟mcp实例
-            mock_mcp = MagicMock()
-            mock_fastmcp.return_value = mock_mcp
-
-            # 模拟playwright模块
-            sys.modules["playwright"] = MagicMock()
-            sys.modules["playwright.async_api"] = MagicMock()
-
-            # 尝试导入模块
-            try:
-                spec = importlib.util.spec_from_file_location("server", server_path)
-                if spec is None:
-                    self.fail(f"无法为文件创建模块规范: {server_path}")
-                server_module = importlib.util.module_from_spec(spec)
-                if spec.loader is None:
-                    self.fail(f"模块规范没有加载器: {server_path}")
-                spec.loader.exec_module(server_module)
-
-                # 检查关键函数是否存在
-                self.assertTrue(
-                    hasattr(server_module, "close_browser_sync"),
-                    "close_browser_sync函数不存在",
-                )
-
-                # 检查是否成功导入了所有必要的函数
-                required_functions = [
-                    "browser_navigate",
-                    "browser_navigate_back",
-                    "browser_navigate_forward",
-                    "browser_click",
-                    "browser_hover",
-                    "browser_type",
-                    "browser_snapshot",
-                    "browser_take_screenshot",
-                    "browser_tab_list",
-                    "browser_tab_new",
-                    "browser_tab_close",
-                    "browser_auto_login",
-                    "browser_search",
-                    "_get_domain_from_url",
-                ]
-
-                for func in required_functions:
-                    self.assertTrue(hasattr(server_module, func), f"{func}函数不存在")
-
-            except Exception as e:
-                self.fail(f"导入server.py时发生错误: {str(e)}")
-
-            # 清理模拟模块
-            if "playwright" in sys.modules:
-                del sys.modules["playwright"]
-            if "playwright.async_api" in sys.modules:
-                del sys.modules["playwright.async_api"]
-
-    def test_browser_demo_imports(self):
-        """测试browser_demo.py能否正确导入所有依赖"""
-        # 获取browser_demo.py的绝对路径
-        demo_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "examples/agents/browser_demo.py",
-            )
-        )
-
-        # 检查文件是否存在
-        self.assertTrue(
-            os.path.exists(demo_path), f"browser_demo.py文件不存在: {demo_path}"
-        )
-
-        # 模拟必要的依赖
-        with (
-            patch("oxygent.MAS") as mock_mas,
-            patch("oxygent.Config") as mock_config,
-            patch("oxygent.oxy") as mock_oxy,
-            patch("asyncio.run") as mock_run,
-        ):
-            # 模拟环境变量
-            env_vars = {
-                "DEFAULT_LLM_API_KEY": "test_api_key",
-                "DEFAULT_LLM_BASE_URL": "https://test.api.com",
-                "DEFAULT_LLM_MODEL_NAME": "test_model",
-            }
-
-            with patch.dict(os.environ, env_vars):
-                # 尝试导入模块
-                try:
-                    spec = importlib.util.spec_from_file_location(
-                        "browser_demo", demo_path
-                    )
-                    if spec is None:
-                        self.fail(f"无法为文件创建模块规范: {demo_path}")
-                    demo_module = importlib.util.module_from_spec(spec)
-                    if spec.loader is None:
-                        self.fail(f"模块规范没有加载器: {demo_path}")
-                    spec.loader.exec_module(demo_module)
-
-                    # 检查关键类是否存在
-                    self.assertTrue(
-                        hasattr(demo_module, "BrowserDemo"), "BrowserDemo类不存在"
-                    )
-                    self.assertTrue(hasattr(demo_module, "main"), "main函数不存在")
-
-                    # 检查BrowserDemo类的关键方法
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "__init__"),
-                        "__init__方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "run_demo"),
-                        "run_demo方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_oxy_space"),
-                        "_create_oxy_space方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_browser_tools"),
-                        "_create_browser_tools方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_http_llm"),
-                        "_create_http_llm方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_filesystem_tools"),
-                        "_create_filesystem_tools方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_browser_agent"),
-                        "_create_browser_agent方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_file_agent"),
-                        "_create_file_agent方法不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module.BrowserDemo, "_create_master_agent"),
-                        "_create_master_agent方法不存在",
-                    )
-
-                    # 测试load_config函数
-                    self.assertTrue(
-                        hasattr(demo_module, "load_config"), "load_config函数不存在"
-                    )
-
-                    # 测试系统提示词常量
-                    self.assertTrue(
-                        hasattr(demo_module, "MASTER_SYSTEM_PROMPT"),
-                        "MASTER_SYSTEM_PROMPT常量不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module, "BROWSER_SYSTEM_PROMPT"),
-                        "BROWSER_SYSTEM_PROMPT常量不存在",
-                    )
-                    self.assertTrue(
-                        hasattr(demo_module, "FILE_SYSTEM_PROMPT"),
-                        "FILE_SYSTEM_PROMPT常量不存在",
-                    )
-
-                except Exception as e:
-                    self.fail(f"导入browser_demo.py时发生错误: {str(e)}")
-
-    def test_browser_demo_initialization(self):
-        """测试BrowserDemo类的初始化功能"""
-        # 获取browser_demo.py的绝对路径
-        demo_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "examples/agents/browser_demo.py",
-            )
-        )
-
-        # 模拟必要的依赖
-        with (
-            patch("oxygent.MAS") as mock_mas,
-            patch("oxygent.Config") as mock_config,
-            patch("oxygent.oxy") as mock_oxy,
-        ):
-            # 模拟环境变量
-            env_vars = {
-                "DEFAULT_LLM_API_KEY": "test_api_key",
-                "DEFAULT_LLM_BASE_URL": "https://test.api.com",
-                "DEFAULT_LLM_MODEL_NAME": "test_model",
-            }
-
-            with patch.dict(os.environ, env_vars):
-                # 导入模块
-                spec = importlib.util.spec_from_file_location("browser_demo", demo_path)
-                if spec is None:
-                    self.fail(f"无法为文件创建模块规范: {demo_path}")
-                demo_module = importlib.util.module_from_spec(spec)
-                if spec.loader is None:
-                    self.fail(f"模块规范没有加载器: {demo_path}")
-                spec.loader.exec_module(demo_module)
-
-                # 模拟BrowserDemo类的方法
-                with patch.object(
-                    demo_module.BrowserDemo, "_create_oxy_space", return_value=[]
-                ) as mock_create_oxy_space:
-                    # 初始化BrowserDemo实例
-                    try:
-                        browser_demo = demo_module.BrowserDemo()
-
-                        # 验证初始化是否成功
-                        self.assertIsNotNone(browser_demo)
-                        self.assertEqual(
-                            browser_demo.config["DEFAULT_LLM_API_KEY"], "test_api_key"
-                        )
-                        self.assertEqual(
-                            browser_demo.config["DEFAULT_LLM_BASE_URL"],
-                            "https://test.api.com",
-                        )
-                        self.assertEqual(
-                            browser_demo.config["DEFAULT_LLM_MODEL_NAME"], "test_model"
-                        )
-
-                        # 验证方法调用
-                        mock_create_oxy_space.assert_called_once()
-                        mock_config.set_agent_llm_model.assert_called_once_with(
-                            "default_llm"
-                        )
-
-                    except Exception as e:
-                        self.fail(f"初始化BrowserDemo实例时发生错误: {str(e)}")
-
-
-if __name__ == "__main__":
-    unittest.main()
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+# 项目根目录下的待测文件，只计算一次路径
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+SERVER_PATH = os.path.join(PROJECT_ROOT, "mcp_servers/browser/server.py")
+DEMO_PATH = os.path.join(PROJECT_ROOT, "examples/agents/browser_demo.py")
+
+
+def load_module(name, path):
+    """从文件路径加载模块"""
+    assert os.path.exists(path), f"文件不存在: {path}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None, f"无法为文件创建模块规范: {path}"
+    assert spec.loader is not None, f"模块规范没有加载器: {path}"
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def server_module():
+    """在模拟FastMCP和playwright的环境下加载一次server.py"""
+    # patch.dict退出时会还原sys.modules，清理模拟模块
+    with (
+        patch("mcp.server.fastmcp.FastMCP") as mock_fastmcp,
+        patch.dict(
+            sys.modules,
+            {"playwright": MagicMock(), "playwright.async_api": MagicMock()},
+        ),
+    ):
+        # 模拟mcp实例，避免实际运行MCP服务器
+        mock_fastmcp.return_value = MagicMock()
+        yield load_module("server", SERVER_PATH)
+
+
+@pytest.fixture(scope="module")
+def demo_env():
+    """在模拟MAS/Config/oxy和环境变量的情况下加载一次browser_demo.py"""
+    env_vars = {
+        "DEFAULT_LLM_API_KEY": "test_api_key",
+        "DEFAULT_LLM_BASE_URL": "https://test.api.com",
+        "DEFAULT_LLM_MODEL_NAME": "test_model",
+    }
+    with (
+        patch("oxygent.MAS"),
+        patch("oxygent.Config") as mock_config,
+        patch("oxygent.oxy"),
+        patch("asyncio.run"),
+        patch.dict(os.environ, env_vars),
+    ):
+        yield load_module("browser_demo", DEMO_PATH), mock_config
+
+
+# server.py 需要导出的工具函数
+REQUIRED_SERVER_FUNCTIONS = [
+    "close_browser_sync",
+    "browser_navigate",
+    "browser_navigate_back",
+    "browser_navigate_forward",
+    "browser_click",
+    "browser_hover",
+    "browser_type",
+    "browser_snapshot",
+    "browser_take_screenshot",
+    "browser_tab_list",
+    "browser_tab_new",
+    "browser_tab_close",
+    "browser_auto_login",
+    "browser_search",
+    "_get_domain_from_url",
+]
+
+# browser_demo.py 需要的类、函数和系统提示词常量
+REQUIRED_DEMO_ATTRS = [
+    "BrowserDemo",
+    "main",
+    "load_config",
+    "MASTER_SYSTEM_PROMPT",
+    "BROWSER_SYSTEM_PROMPT",
+    "FILE_SYSTEM_PROMPT",
+]
+
+# BrowserDemo 类的关键方法
+REQUIRED_DEMO_METHODS = [
+    "__init__",
+    "run_demo",
+    "_create_oxy_space",
+    "_create_browser_tools",
+    "_create_http_llm",
+    "_create_filesystem_tools",
+    "_create_browser_agent",
+    "_create_file_agent",
+    "_create_master_agent",
+]
+
+
+@pytest.mark.parametrize("name", REQUIRED_SERVER_FUNCTIONS)
+def test_server_imports(server_module, name):
+    """测试server.py能否正确导入所有依赖"""
+    assert hasattr(server_module, name), f"{name}函数不存在"
+
+
+@pytest.mark.parametrize("name", REQUIRED_DEMO_ATTRS)
+def test_browser_demo_imports(demo_env, name):
+    """测试browser_demo.py能否正确导入所有依赖"""
+    demo_module, _ = demo_env
+    assert hasattr(demo_module, name), f"{name}不存在"
+
+
+@pytest.mark.parametrize("name", REQUIRED_DEMO_METHODS)
+def test_browser_demo_methods(demo_env, name):
+    """测试BrowserDemo类的关键方法是否存在"""
+    demo_module, _ = demo_env
+    assert hasattr(demo_module.BrowserDemo, name), f"{name}方法不存在"
+
+
+def test_browser_demo_initialization(demo_env):
+    """测试BrowserDemo类的初始化功能"""
+    demo_module, mock_config = demo_env
+    mock_config.reset_mock()
+
+    # 模拟BrowserDemo类的方法
+    with patch.object(
+        demo_module.BrowserDemo, "_create_oxy_space", return_value=[]
+    ) as mock_create_oxy_space:
+        # 初始化BrowserDemo实例
+        browser_demo = demo_module.BrowserDemo()
+
+    # 验证初始化是否成功
+    assert browser_demo is not None
+    assert browser_demo.config["DEFAULT_LLM_API_KEY"] == "test_api_key"
+    assert browser_demo.config["DEFAULT_LLM_BASE_URL"] == "https://test.api.com"
+    assert browser_demo.config["DEFAULT_LLM_MODEL_NAME"] == "test_model"
+
+    # 验证方法调用
+    mock_create_oxy_space.assert_called_once()
+    mock_config.set_agent_llm_model.assert_called_once_with("default_llm")
+
+
+def test_package_mcp_registers_all_tools():
+    """测试从包中导入mcp时所有子模块的工具均已注册"""
+    # server_module夹具在本模块内模拟了FastMCP并缓存了子模块，这里恢复真实实现后重新导入
+    with (
+        patch("mcp.server.fastmcp.FastMCP", FastMCP),
+        patch.dict(
+            sys.modules,
+            {"playwright": MagicMock(), "playwright.async_api": MagicMock()},
+        ),
+    ):
+        for module_name in [
+            m for m in sys.modules if m.startswith("mcp_servers.browser")
+        ]:
+            del sys.modules[module_name]
+        mcp = importlib.import_module("mcp_servers.browser").mcp
+        tool_names = {tool.name for tool in mcp._tool_manager.list_tools()}
+
+    assert {"browser_navigate", "browser_click", "browser_search"} <= tool_names
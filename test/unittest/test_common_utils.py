@@ -5,6 +5,8 @@ Unit tests for oxygent.utils.common_utils
 import asyncio
 import hashlib
 import json
+import sys
+import types
 
 import pytest
 
@@ -25,6 +27,21 @@ def test_extract_json_functions():
         cu.extract_json_str("no-json")
 
 
+def test_stream_json_scanner():
+    scanner = cu.StreamJSONScanner()
+    chunks = [
+        "<thi",
+        "nk>{ignored}</think>",
+        'ok {"tool_name": "a", ',
+        '"arguments": {"q": "}"}}',
+        " tail",
+    ]
+    found = [scanner.feed(c) for c in chunks]
+    assert found[:3] == [None, None, None]
+    assert found[3] == '{"tool_name": "a", "arguments": {"q": "}"}}'
+    assert found[4] is None
+
+
 def test_url_helpers():
     assert cu.append_url_path("https://a.com/api", "/v1") == "https://a.com/api/v1"
     built = cu.build_url("https://a.com", "chat", {"q": "x", "q": ["y"]})  # noqa: F601
@@ -44,6 +61,47 @@ def test_get_md5_and_to_json():
     assert cu.to_json({"x": 1}) == json.dumps({"x": 1}, ensure_ascii=False)
 
 
+def test_process_attachments_item_types():
+    items = cu.process_attachments(
+        ["http://x/a.PNG", "http://x/t.csv", "http://x/p.pdf", "http://x/z.bin"]
+    )
+    assert items == [
+        {"type": "image_url", "image_url": {"url": "http://x/a.PNG"}},
+        {
+            "type": "table_file",
+            "table_file": {"url": "http://x/t.csv", "format": "csv"},
+        },
+        {"type": "pdf_file", "pdf_file": {"url": "http://x/p.pdf", "format": "pdf"}},
+        {"type": "file", "file": {"url": "http://x/z.bin", "format": "bin"}},
+    ]
+    assert cu.process_attachments(["/no/such/file.png"]) == []
+
+
+def test_generate_uuid():
+    ids = {cu.generate_uuid(length=22) for _ in range(100)}
+    assert len(ids) == 100
+    assert all(len(i) == 22 and i.isascii() for i in ids)
+    assert len(cu.generate_uuid()) == 16
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert cu.install_uvloop() is False
+
+
+def test_install_uvloop_sets_policy(monkeypatch):
+    class FakePolicy:
+        pass
+
+    fake_uvloop = types.SimpleNamespace(EventLoopPolicy=FakePolicy)
+    installed = []
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    monkeypatch.setattr(cu.asyncio, "set_event_loop_policy", installed.append)
+
+    assert cu.install_uvloop() is True
+    assert len(installed) == 1 and isinstance(installed[0], FakePolicy)
+
+
 @pytest.fixture(autouse=True)
 def patch_source_to_bytes(monkeypatch):
     monkeypatch.setattr(
@@ -57,6 +57,20 @@ def test_get_env_var_missing(monkeypatch):
         env_utils.get_env_var("NOT_SET", str)
 
 
+def test_get_llm_env_resolves_once(monkeypatch):
+    env_utils.get_llm_env.cache_clear()
+    monkeypatch.setenv("DEFAULT_LLM_API_KEY", "key")
+    monkeypatch.setenv("DEFAULT_LLM_BASE_URL", "https://llm.example.com")
+    monkeypatch.setenv("DEFAULT_LLM_MODEL_NAME", "model")
+
+    llm_env = env_utils.get_llm_env()
+    assert llm_env == env_utils.LLMEnv("key", "https://llm.example.com", "model")
+
+    monkeypatch.setenv("DEFAULT_LLM_MODEL_NAME", "other")
+    assert env_utils.get_llm_env() is llm_env
+    env_utils.get_llm_env.cache_clear()
+
+
 # ---------- simple getters --------------------------------------------------
 
 
@@ -2,6 +2,9 @@
 Unit tests for HttpLLM
 """
 
+import asyncio
+
+import orjson
 import pytest
 
 from oxygent.oxy.llms.http_llm import HttpLLM
@@ -64,8 +67,7 @@ async def test_execute_success(monkeypatch, llm, oxy_request):
 
     # ----- mock httpx.AsyncClient ------------------------------------------------
     class FakeResponse:
-        def json(self):
-            return {"choices": [{"message": {"content": "Hi there!"}}]}
+        content = orjson.dumps({"choices": [{"message": {"content": "Hi there!"}}]})
 
         def raise_for_status(self):
             pass
@@ -77,10 +79,10 @@ async def test_execute_success(monkeypatch, llm, oxy_request):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def post(self, url, headers=None, json=None):
+        async def post(self, url, headers=None, content=None):
             captured["url"] = url
             captured["headers"] = headers
-            captured["payload"] = json
+            captured["payload"] = orjson.loads(content)
             return FakeResponse()
 
     monkeypatch.setattr(
@@ -128,3 +130,211 @@ async def test_execute_http_error(monkeypatch, llm, oxy_request):
 
     with pytest.raises(FakeErrResponse):
         await llm._execute(oxy_request)
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_stops_on_tool_call(monkeypatch, llm, oxy_request):
+    llm.llm_params = {"stream": True}
+    llm.is_stop_stream_on_tool_call = True
+    lines = [
+        'data: {"choices": [{"delta": {"content": "{\\"tool_name\\": \\"t\\", "}}]}',
+        'data: {"choices": [{"delta": {"content": "\\"arguments\\": {}}"}}]}',
+        'data: {"choices": [{"delta": {"content": " never read"}}]}',
+        "data: [DONE]",
+    ]
+
+    class FakeStream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def aiter_lines(self):
+            for line in lines:
+                yield line
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        def stream(self, *a, **kw):
+            return FakeStream()
+
+    async def fake_send_message(self, message):
+        pass
+
+    monkeypatch.setattr(
+        "oxygent.oxy.llms.http_llm.httpx.AsyncClient", lambda *a, **k: FakeClient()
+    )
+    monkeypatch.setattr(OxyRequest, "send_message", fake_send_message)
+
+    resp: OxyResponse = await llm._execute(oxy_request)
+
+    assert resp.output == '{"tool_name": "t", "arguments": {}}'
+
+
+@pytest.mark.asyncio
+async def test_execute_reuses_http_client(monkeypatch, llm, oxy_request):
+    created = []
+
+    class FakeResponse:
+        content = orjson.dumps({"choices": [{"message": {"content": "ok"}}]})
+
+        def raise_for_status(self):
+            pass
+
+    class FakeClient:
+        is_closed = False
+
+        def __init__(self, *a, **k):
+            created.append(self)
+
+        async def post(self, *a, **kw):
+            return FakeResponse()
+
+        async def aclose(self):
+            self.is_closed = True
+
+    monkeypatch.setattr("oxygent.oxy.llms.http_llm.httpx.AsyncClient", FakeClient)
+
+    await llm._execute(oxy_request)
+    await llm._execute(oxy_request)
+    assert len(created) == 1
+
+    await llm.cleanup()
+    assert created[0].is_closed
+
+
+def test_mark_system_prompt_cacheable():
+    messages = [
+        {"role": "system", "content": "You are helpful."},
+        {"role": "user", "content": "Hi"},
+    ]
+    marked = HttpLLM._mark_system_prompt_cacheable(messages)
+
+    assert marked[0]["content"] == [
+        {
+            "type": "text",
+            "text": "You are helpful.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert marked[1] is messages[1]
+    assert messages[0]["content"] == "You are helpful."
+    assert HttpLLM._mark_system_prompt_cacheable(messages[1:]) == messages[1:]
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_shared_http_client(monkeypatch, oxy_request):
+    async def passthrough(self, req: OxyRequest):
+        return req.arguments["messages"]
+
+    monkeypatch.setattr(
+        "oxygent.oxy.llms.base_llm.BaseLLM._get_messages", passthrough, raising=True
+    )
+
+    class FakeResponse:
+        content = orjson.dumps({"choices": [{"message": {"content": "ok"}}]})
+
+        def raise_for_status(self):
+            pass
+
+    class SharedClient:
+        is_closed = False
+        calls = 0
+
+        async def post(self, *a, **kw):
+            self.calls += 1
+            return FakeResponse()
+
+        async def aclose(self):
+            self.is_closed = True
+
+    shared_client = SharedClient()
+    llms = [
+        HttpLLM(
+            name=f"http_llm_{i}",
+            api_key="sk-123",
+            base_url="https://api.fake.com/v1",
+            model_name="gpt-ut",
+            http_client=shared_client,
+        )
+        for i in range(2)
+    ]
+    for shared_llm in llms:
+        await shared_llm._execute(oxy_request)
+        await shared_llm.cleanup()
+
+    assert shared_client.calls == 2
+    assert not shared_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_single_flight_keeps_api_keys_apart(monkeypatch, oxy_request):
+    async def passthrough(self, req: OxyRequest):
+        return req.arguments["messages"]
+
+    monkeypatch.setattr(
+        "oxygent.oxy.llms.base_llm.BaseLLM._get_messages", passthrough, raising=True
+    )
+
+    class FakeResponse:
+        content = orjson.dumps({"choices": [{"message": {"content": "ok"}}]})
+
+        def raise_for_status(self):
+            pass
+
+    class SlowClient:
+        is_closed = False
+
+        def __init__(self):
+            self.authorizations = []
+
+        async def post(self, *a, headers, **kw):
+            self.authorizations.append(headers["Authorization"])
+            await asyncio.sleep(0.01)
+            return FakeResponse()
+
+    slow_client = SlowClient()
+    llms = [
+        HttpLLM(
+            name=f"http_llm_{api_key}",
+            api_key=api_key,
+            base_url="https://api.fake.com/v1",
+            model_name="gpt-ut",
+            http_client=slow_client,
+            is_single_flight=True,
+        )
+        for api_key in ("sk-a", "sk-b")
+    ]
+    await asyncio.gather(*[llm._execute(oxy_request) for llm in llms])
+
+    assert sorted(slow_client.authorizations) == ["Bearer sk-a", "Bearer sk-b"]
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    captured = {}
+
+    class FakeClient:
+        is_closed = False
+
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+    monkeypatch.setattr("oxygent.oxy.llms.http_llm.httpx.AsyncClient", FakeClient)
+    monkeypatch.setattr("oxygent.oxy.llms.http_llm._HAS_H2", False)
+    llm = HttpLLM(
+        name="http2_llm",
+        api_key="sk-123",
+        base_url="https://api.fake.com/v1",
+        model_name="gpt-ut",
+        is_http2=True,
+    )
+
+    llm._get_http_client()
+
+    assert captured["http2"] is False
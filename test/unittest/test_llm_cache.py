@@ -0,0 +1,90 @@
+"""
+Unit tests for LLMResponseCache
+"""
+
+import numpy as np
+import pytest
+
+import oxygent.llm_cache as lc
+
+
+def make_payload(query, temperature=0.1):
+    return {
+        "model": "gpt-ut",
+        "temperature": temperature,
+        "messages": [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": query},
+        ],
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tests
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_exact_hit_trims_query_only():
+    cache = lc.LLMResponseCache()
+    assert await cache.get(make_payload("Hello  world")) is None
+
+    await cache.set(make_payload("Hello  world"), "hi")
+    assert await cache.get(make_payload(" Hello  world\n")) == "hi"
+    assert await cache.get(make_payload("hello  world")) is None
+    assert await cache.get(make_payload("Hello world")) is None
+    assert await cache.get(make_payload("Hello  world", temperature=0.0)) is None
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_exact_key_keeps_system_message_case():
+    cache = lc.LLMResponseCache()
+    upper = make_payload("q")
+    upper["messages"][0]["content"] = "Reply with Foo."
+    lower = make_payload("q")
+    lower["messages"][0]["content"] = "Reply with foo."
+
+    await cache.set(upper, "Foo")
+    assert await cache.get(lower) is None
+    assert await cache.get(upper) == "Foo"
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_requires_same_context(monkeypatch):
+    vectors = {
+        "What time is it": np.array([1.0, 0.0]),
+        "current time": np.array([0.96, 0.28]),
+        "weather": np.array([0.0, 1.0]),
+    }
+
+    async def fake_embed(texts):
+        return [vectors[t] for t in texts]
+
+    monkeypatch.setattr(lc, "get_embedding", fake_embed)
+
+    cache = lc.LLMResponseCache(semantic_threshold=0.92)
+    await cache.set(make_payload("What time is it"), "12:00")
+
+    assert await cache.get(make_payload("current time")) == "12:00"
+    assert await cache.get(make_payload("weather")) is None
+
+    other_context = make_payload("current time")
+    other_context["messages"][0]["content"] = "You are terse."
+    assert await cache.get(other_context) is None
+
+
+@pytest.mark.asyncio
+async def test_capacity_evicts_least_recently_used(monkeypatch):
+    async def fake_embed(texts):
+        return [np.array([1.0, 0.0]) for _ in texts]
+
+    monkeypatch.setattr(lc, "get_embedding", fake_embed)
+
+    cache = lc.LLMResponseCache(semantic_threshold=0.92, capacity=2)
+    await cache.set(make_payload("a"), "A")
+    await cache.set(make_payload("b"), "B")
+    assert await cache.get(make_payload("a")) == "A"
+    await cache.set(make_payload("c"), "C")
+
+    assert len(cache._exact) == 2
+    assert sorted(cache._exact.values()) == ["A", "C"]
+    assert sum(len(entry) for entry in cache._semantic.values()) == 2
@@ -0,0 +1,42 @@
+"""
+Unit tests for oxygent.utils.llm_parse
+"""
+
+import pytest
+
+from oxygent.schemas import LLMState
+from oxygent.utils.llm_parse import func_parse_llm_response, parse_llm_response
+
+
+@pytest.mark.parametrize(
+    "ori_response, state",
+    [
+        ('<think>x</think>```json\n{"tool_name": "t", "arguments": {}}\n```', "TOOL"),
+        ('{"answer": 1}', "ANSWER"),
+        ("plain text answer", "ANSWER"),
+        ('{"tool_name": "t", "arguments": {x}}', "ERROR"),
+    ],
+)
+def test_parse_llm_response_states(ori_response, state):
+    expected = {
+        "TOOL": LLMState.TOOL_CALL,
+        "ANSWER": LLMState.ANSWER,
+        "ERROR": LLMState.ERROR_PARSE,
+    }[state]
+    assert parse_llm_response(ori_response).state == expected
+
+
+def test_parse_llm_response_strips_think():
+    resp = func_parse_llm_response('<think>a</think>{"tool_name": "t"}', None)
+    assert resp.output == {"tool_name": "t"}
+    assert resp.ori_response == '{"tool_name": "t"}'
+
+
+def test_parse_llm_response_returns_independent_arguments():
+    text = '{"tool_name": "t", "arguments": {"query": "q"}}'
+    first = parse_llm_response(text)
+    first.output["arguments"]["short_memory"] = [{"role": "user", "content": "x"}]
+
+    second = parse_llm_response(text)
+
+    assert second.output == {"tool_name": "t", "arguments": {"query": "q"}}
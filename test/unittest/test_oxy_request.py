@@ -22,6 +22,7 @@ class DummyMAS:
         self.background_tasks = set()
         self.message_prefix = "msg"
         self.name = "ut_mas"
+        self.global_data = {}
 
     async def send_message(self, message, redis_key):
         self.last_msg = (redis_key, message)
@@ -80,6 +81,28 @@ def test_deepcopy_resets_parallel_ids(base_request):
     assert dup.latest_node_ids == []
 
 
+def test_deepcopy_shares_scoped_data(base_request):
+    base_request.set_group_data("k", "v")
+    dup = base_request.__deepcopy__({})
+    assert dup.mas is base_request.mas
+    assert dup.shared_data is base_request.shared_data
+    assert dup.group_data is base_request.group_data
+
+
+def test_append_to_query(base_request):
+    base_request.set_query("hello")
+    assert base_request.append_to_query("???") is base_request
+    assert base_request.get_query() == "hello???"
+    base_request.append_to_query("!", master_level=True)
+    assert base_request.get_query(master_level=True) == "!"
+
+
+def test_incr_global_data(base_request):
+    assert base_request.incr_global_data("counter") == 1
+    assert base_request.incr_global_data("counter", 2) == 3
+    assert base_request.get_global_data("counter") == 3
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # ❹ retry_execute
 # ──────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,32 @@
+"""
+Unit tests for TokenBucket
+"""
+
+import time
+
+import pytest
+
+from oxygent.utils.rate_limit import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_after_burst():
+    bucket = TokenBucket(capacity=2, refill_per_sec=50)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.01
+
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_acquire_clamps_to_capacity():
+    bucket = TokenBucket.per_minute(600)
+
+    await bucket.acquire(10_000)
+
+    assert bucket.capacity == 600
+    assert bucket.refill_per_sec == 10
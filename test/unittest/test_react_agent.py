@@ -2,6 +2,7 @@
 Unit tests for ReActAgent
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
@@ -11,6 +12,7 @@ from oxygent.oxy.agents.react_agent import LLMState, ReActAgent
 from oxygent.oxy.base_tool import BaseTool
 from oxygent.oxy.function_tools.function_tool import FunctionTool
 from oxygent.schemas import (
+    LLMResponse,
     OxyRequest,
     OxyResponse,
     OxyState,
@@ -150,3 +152,96 @@ async def test_execute_trust_mode(react_agent, oxy_request):
 async def test_permitted_tool_list(react_agent):
     await react_agent.init()
     assert "dummy_tool" in react_agent.permitted_tool_name_list
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_skips_first_llm_call(react_agent, oxy_request, monkeypatch):
+    react_agent.is_plan_cache = True
+    calls = []
+    fake_call = OxyRequest.call
+
+    async def _counting_call(self, *, callee: str, arguments: dict, **kwargs):
+        calls.append(callee)
+        return await fake_call(self, callee=callee, arguments=arguments, **kwargs)
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _counting_call)
+
+    await react_agent.execute(oxy_request)
+    oxy_request.arguments["query"] = "  Hello "
+    result = await react_agent.execute(oxy_request)
+
+    assert result.state is OxyState.COMPLETED
+    assert calls == ["mock_llm", "dummy_tool", "dummy_tool"]
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_replays_fresh_arguments(
+    react_agent, oxy_request, mas_env, monkeypatch
+):
+    react_agent.is_plan_cache = True
+    sub_agent = ReActAgent(name="agent_sub", desc="UT sub agent", llm_model="mock_llm")
+    sub_agent.set_mas(mas_env)
+    mas_env.oxy_name_to_oxy["agent_sub"] = sub_agent
+    seen_arguments = []
+
+    async def _sub_agent_call(self, *, callee: str, arguments: dict, **kwargs):
+        if callee == "mock_llm":
+            llm_output = json.dumps(
+                {"tool_name": "agent_sub", "arguments": {"query": "q"}}
+            )
+            return OxyResponse(
+                state=OxyState.COMPLETED, output=llm_output, oxy_request=self
+            )
+        seen_arguments.append(dict(arguments))
+        # Like OxyRequest.call, hand the arguments dict to the callee as-is
+        sub_request = self.clone_with(callee=callee, arguments=arguments)
+        await sub_agent._pre_process(sub_request)
+        return OxyResponse(
+            state=OxyState.COMPLETED, output="sub-agent-ok", oxy_request=self
+        )
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _sub_agent_call)
+
+    await react_agent.execute(oxy_request)
+    await react_agent.execute(oxy_request)
+
+    assert seen_arguments[0] == {"query": "q"}
+    assert seen_arguments[-1] == {"query": "q"}
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_bounds_parallel_tool_calls(
+    react_agent, oxy_request, monkeypatch
+):
+    react_agent.max_concurrency = 2
+    llm_outputs = ["tool calls", "final answer"]
+
+    def _parse(ori_response, oxy_request=None):
+        if ori_response == "tool calls":
+            tool_calls = [{"tool_name": "dummy_tool", "arguments": {}}] * 5
+            return LLMResponse(state=LLMState.TOOL_CALL, output=tool_calls)
+        return LLMResponse(state=LLMState.ANSWER, output=ori_response)
+
+    react_agent.func_parse_llm_response = _parse
+    running, peak = 0, 0
+
+    async def _fan_out_call(self, *, callee: str, arguments: dict, **kwargs):
+        nonlocal running, peak
+        if callee == "mock_llm":
+            return OxyResponse(
+                state=OxyState.COMPLETED, output=llm_outputs.pop(0), oxy_request=self
+            )
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return OxyResponse(
+            state=OxyState.COMPLETED, output="tool-exec-ok", oxy_request=self
+        )
+
+    monkeypatch.setattr("oxygent.schemas.OxyRequest.call", _fan_out_call)
+
+    result = await react_agent.execute(oxy_request)
+
+    assert result.output == "final answer"
+    assert peak == 2
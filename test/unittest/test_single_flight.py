@@ -0,0 +1,44 @@
+"""
+Unit tests for single_flight
+"""
+
+import asyncio
+
+import pytest
+
+from oxygent.utils.single_flight import single_flight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*[single_flight("k", fetch) for _ in range(5)])
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert await single_flight("k", fetch) == "result"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_key_released():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        single_flight("err", fail), single_flight("err", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+    async def ok():
+        return "ok"
+
+    assert await single_flight("err", ok) == "ok"
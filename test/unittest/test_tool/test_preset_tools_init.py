@@ -0,0 +1,30 @@
+import importlib
+
+from oxygent import preset_tools
+from oxygent.oxy import FunctionHub
+
+
+def test_lazy_attribute_resolves_function_hub():
+    assert isinstance(preset_tools.math_tools, FunctionHub)
+
+
+def test_all_rebinds_hub_over_imported_submodule():
+    importlib.import_module("oxygent.preset_tools.python_tools")
+    assert "python_tools" in preset_tools.__all__
+    assert isinstance(preset_tools.python_tools, FunctionHub)
+
+
+def test_all_skips_tools_that_fail_to_load(monkeypatch):
+    monkeypatch.setattr(
+        preset_tools, "tool_modules", [*preset_tools.tool_modules, "missing_tools"]
+    )
+    monkeypatch.delitem(vars(preset_tools), "__all__", raising=False)
+    namespace = {}
+    try:
+        exec("from oxygent.preset_tools import *", namespace)
+    finally:
+        vars(preset_tools).pop("missing_tools", None)
+
+    assert "math_tools" in namespace
+    assert "missing_tools" not in namespace
+    assert "missing_tools" not in preset_tools.__all__